@@ -18,11 +18,21 @@ if sys.platform == "win32" and getattr(sys, 'frozen', False):
 
     # Pre-load system DLLs that onnxruntime.dll depends on.
     # All 5 are needed when sounddevice's PortAudio DLLs are also bundled.
+    # They are independent, so load them concurrently: the loader lock serializes
+    # mapping, but file I/O and page faults for each DLL overlap.
     system32 = os.path.join(os.environ.get('SystemRoot', r'C:\Windows'), 'System32')
-    for dep in ['dxgi.dll', 'dbghelp.dll', 'SETUPAPI.dll', 'MSVCP140.dll', 'MSVCP140_1.dll']:
-        k32.LoadLibraryExW(os.path.join(system32, dep), None, 0)
+    deps = [os.path.join(system32, dep)
+            for dep in ['dxgi.dll', 'dbghelp.dll', 'SETUPAPI.dll', 'MSVCP140.dll', 'MSVCP140_1.dll']]
+    try:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            list(ex.map(lambda path: k32.LoadLibraryExW(path, None, 0), deps))
+    except Exception:
+        # Threading unavailable this early in the frozen app: load serially
+        for path in deps:
+            k32.LoadLibraryExW(path, None, 0)
 
-    # Pre-load onnxruntime DLLs
+    # Pre-load onnxruntime DLLs (sequential: providers_shared depends on onnxruntime.dll)
     for dll in ['onnxruntime.dll', 'onnxruntime_providers_shared.dll']:
         for search_dir in [ort_capi, base]:
             path = os.path.join(search_dir, dll)
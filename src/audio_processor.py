@@ -4,12 +4,28 @@ Handles format conversion, resampling, normalization, and validation.
 """
 
 import numpy as np
-import soundfile as sf
 import tempfile
 import os
+from fractions import Fraction
+from functools import lru_cache
 from .config import TARGET_SAMPLE_RATE, MAX_AUDIO_LENGTH
 
 
+@lru_cache(maxsize=8)
+def _resample_filter(up, down):
+    """
+    Design (and cache) the anti-aliasing FIR filter for a polyphase resample.
+
+    Mirrors scipy.signal.resample_poly's default Kaiser-windowed design so the
+    filter is only built once per (up, down) ratio.
+    """
+    from scipy.signal import firwin
+
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    return firwin(2 * half_len + 1, 1.0 / max_rate, window=('kaiser', 5.0))
+
+
 def convert_to_16khz_mono(audio_data, sample_rate):
     """
     Convert audio to 16kHz mono format.
@@ -22,47 +38,99 @@ def convert_to_16khz_mono(audio_data, sample_rate):
         tuple: (converted_audio, new_sample_rate)
     """
     # Convert stereo to mono if needed
-    if len(audio_data.shape) > 1 and audio_data.shape[1] > 1:
-        # Average all channels
-        audio_data = np.mean(audio_data, axis=1)
+    if len(audio_data.shape) > 1 and audio_data.shape[1] == 2:
+        # Common stereo case: (L + R) * 0.5 as one float32 add plus an in-place
+        # scale, which vectorizes better than a mean reduction over axis 1
+        audio_data = np.ascontiguousarray(audio_data)
+        audio_data = np.add(audio_data[:, 0], audio_data[:, 1], dtype=np.float32)
+        audio_data *= np.float32(0.5)
+    elif len(audio_data.shape) > 1 and audio_data.shape[1] > 2:
+        # Average all channels, accumulating straight into float32 so the
+        # downmix and the cast happen in one pass (np.mean on int16 would
+        # otherwise produce a float64 array that gets cast again later)
+        audio_data = np.mean(audio_data, axis=1, dtype=np.float32)
 
     # Resample if needed
     if sample_rate != TARGET_SAMPLE_RATE:
-        # Calculate number of samples after resampling
-        num_samples = int(len(audio_data) * TARGET_SAMPLE_RATE / sample_rate)
-        # Use numpy linear interpolation for lightweight resampling
-        old_indices = np.linspace(0, len(audio_data) - 1, num_samples)
-        audio_data = np.interp(old_indices, np.arange(len(audio_data)), audio_data).astype(np.float32)
+        try:
+            from scipy.signal import resample_poly
+
+            # Polyphase FIR resampling with an integer up/down ratio (e.g. 44100 -> 16000 is 160/441)
+            frac = Fraction(TARGET_SAMPLE_RATE, int(sample_rate)).limit_denominator(1000)
+            up, down = frac.numerator, frac.denominator
+            audio_data = resample_poly(
+                audio_data, up, down, window=_resample_filter(up, down)
+            ).astype(np.float32, copy=False)
+        except ImportError:
+            # scipy not installed: fall back to numpy linear interpolation
+            num_samples = int(len(audio_data) * TARGET_SAMPLE_RATE / sample_rate)
+            old_indices = np.linspace(0, len(audio_data) - 1, num_samples)
+            audio_data = np.interp(old_indices, np.arange(len(audio_data)), audio_data).astype(np.float32)
 
     return audio_data, TARGET_SAMPLE_RATE
 
 
-def normalize_audio(audio_data):
+def peak_amplitude(audio_data):
+    """
+    Return the peak absolute amplitude of an audio buffer.
+
+    Uses a min and a max reduction instead of np.max(np.abs(...)) so no
+    temporary |x| array the size of the input is allocated.
+
+    Args:
+        audio_data: numpy array of audio samples
+
+    Returns:
+        float: peak absolute amplitude (0.0 for empty input)
+    """
+    if audio_data.size == 0:
+        return 0.0
+    # Negate as a Python float so int16's -32768 cannot overflow
+    return max(-float(audio_data.min()), float(audio_data.max()))
+
+
+def normalize_audio(audio_data, peak=None):
     """
     Normalize audio to float32 in range [-1, 1].
 
     Args:
         audio_data: numpy array of audio samples
+        peak: precomputed peak amplitude (computed here if None)
 
     Returns:
         numpy array: normalized audio
     """
-    # Convert to float32
-    audio_data = audio_data.astype(np.float32)
-
-    # Check if audio is silent (all zeros)
-    if np.max(np.abs(audio_data)) == 0:
-        return audio_data
+    # Convert to float32 (no copy if the downmix already produced float32)
+    audio_data = audio_data.astype(np.float32, copy=False)
 
-    # Normalize to [-1, 1] range
-    max_val = np.max(np.abs(audio_data))
+    # Normalize to [-1, 1] range; a single peak scan also covers silent (all-zero) audio
+    max_val = peak_amplitude(audio_data) if peak is None else peak
     if max_val > 1.0:
-        audio_data = audio_data / max_val
+        audio_data = audio_data * np.float32(1.0 / max_val)
 
     return audio_data
 
 
-def validate_audio_length(audio_data, sample_rate, max_seconds=MAX_AUDIO_LENGTH, min_seconds=0.1):
+def pcm_to_float32(audio_data):
+    """
+    Convert integer PCM samples to float32 in range [-1, 1].
+
+    Unlike normalize_audio, this scales by the dtype's fixed full-scale value,
+    so consecutive streaming chunks keep a consistent gain.
+
+    Args:
+        audio_data: numpy array of audio samples (integer or float)
+
+    Returns:
+        numpy array: float32 audio
+    """
+    if np.issubdtype(audio_data.dtype, np.integer):
+        full_scale = -float(np.iinfo(audio_data.dtype).min)
+        return audio_data.astype(np.float32) * np.float32(1.0 / full_scale)
+    return audio_data.astype(np.float32, copy=False)
+
+
+def validate_audio_length(audio_data, sample_rate, max_seconds=MAX_AUDIO_LENGTH, min_seconds=0.1, peak=None):
     """
     Validate audio length and return duration info.
 
@@ -71,6 +139,7 @@ def validate_audio_length(audio_data, sample_rate, max_seconds=MAX_AUDIO_LENGTH,
         sample_rate: sample rate of audio
         max_seconds: maximum recommended length
         min_seconds: minimum required length
+        peak: precomputed peak amplitude (computed here if None)
 
     Returns:
         tuple: (duration_seconds, warning_message or None)
@@ -85,7 +154,7 @@ def validate_audio_length(audio_data, sample_rate, max_seconds=MAX_AUDIO_LENGTH,
         raise ValueError(f"Audio too short ({duration:.2f}s). Minimum {min_seconds}s required.")
 
     # Check if audio is essentially silent
-    max_amplitude = np.max(np.abs(audio_data))
+    max_amplitude = peak_amplitude(audio_data) if peak is None else peak
     if max_amplitude < 0.001:
         raise ValueError("Audio is silent or too quiet. Please speak louder.")
 
@@ -98,7 +167,10 @@ def validate_audio_length(audio_data, sample_rate, max_seconds=MAX_AUDIO_LENGTH,
 
 def save_temp_audio(audio_data, sample_rate):
     """
-    Save audio to a temporary WAV file.
+    Save audio to a temporary 16-bit PCM WAV file.
+
+    Only needed for consumers that require a file (e.g. Google Speech
+    Recognition); Whisper takes the float32 array directly.
 
     Args:
         audio_data: numpy array of audio samples
@@ -107,6 +179,9 @@ def save_temp_audio(audio_data, sample_rate):
     Returns:
         str: path to temporary WAV file
     """
+    # Imported lazily: libsndfile is only needed when a file is actually written
+    import soundfile as sf
+
     # Create a temporary file
     temp_file = tempfile.NamedTemporaryFile(
         delete=False,
@@ -116,8 +191,8 @@ def save_temp_audio(audio_data, sample_rate):
     temp_path = temp_file.name
     temp_file.close()
 
-    # Write audio to file
-    sf.write(temp_path, audio_data, sample_rate)
+    # Write audio to file as 16-bit PCM (half the bytes of float32; ample range for speech)
+    sf.write(temp_path, audio_data, sample_rate, subtype='PCM_16')
 
     return temp_path
 
@@ -131,18 +206,20 @@ def process_audio(audio_data, sample_rate):
         sample_rate: original sample rate
 
     Returns:
-        tuple: (temp_file_path, duration, warning_message or None)
+        tuple: (audio_data, duration, warning_message or None) where audio_data
+        is float32 mono at TARGET_SAMPLE_RATE. Call save_temp_audio() when a
+        consumer needs a file on disk.
     """
     # Convert to 16kHz mono
     audio_data, new_sample_rate = convert_to_16khz_mono(audio_data, sample_rate)
 
-    # Normalize audio
-    audio_data = normalize_audio(audio_data)
+    # Scan the peak once and share it between normalization and validation
+    peak = peak_amplitude(audio_data)
 
-    # Validate length
-    duration, warning = validate_audio_length(audio_data, new_sample_rate)
+    # Normalize audio
+    audio_data = normalize_audio(audio_data, peak=peak)
 
-    # Save to temporary file
-    temp_path = save_temp_audio(audio_data, new_sample_rate)
+    # Validate length (normalization scales any peak above 1.0 down to exactly 1.0)
+    duration, warning = validate_audio_length(audio_data, new_sample_rate, peak=min(peak, 1.0))
 
-    return temp_path, duration, warning
+    return audio_data, duration, warning
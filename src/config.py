@@ -4,6 +4,8 @@ Configuration settings for the speech-to-text application.
 
 # Whisper settings
 WHISPER_MODEL = "base"  # Options: tiny, base, small, medium, large
+WHISPER_BACKEND = "faster-whisper"  # Options: faster-whisper (CTranslate2), openai-whisper (used if faster-whisper is missing)
+WHISPER_COMPUTE_TYPE = None  # faster-whisper only; None = int8_float16 on GPU, int8 on CPU
 WHISPER_LANGUAGE = None  # Auto-detect by default (set to "en", "es", etc. to override)
 
 # Ollama settings
@@ -15,7 +17,31 @@ OLLAMA_TIMEOUT = 30  # seconds
 TARGET_SAMPLE_RATE = 16000  # 16kHz required for optimal processing
 MAX_AUDIO_LENGTH = 30  # seconds (recommended maximum)
 AUDIO_FORMAT = "wav"
+STREAM_BUFFER_SECONDS = 30  # Max uncommitted audio kept for real-time transcription
+STREAM_VAD_THRESHOLD = 0.5  # Silero VAD speech probability that counts as speech
+STREAM_SILENCE_HOLD = 0.4  # seconds of silence before streaming stops calling Whisper
 
 # UI settings
 GRADIO_THEME = "soft"
 SHARE_LINK = False  # Set True to create public Gradio link
+
+# (label, value) choices for the web UI dropdowns
+LANGUAGE_CHOICES = (
+    ("Auto-detect", "auto"),
+    ("English", "en"),
+    ("Spanish", "es"),
+    ("French", "fr"),
+    ("German", "de"),
+    ("Chinese (Mandarin)", "zh"),
+    ("Cantonese", "yue"),
+    ("Japanese", "ja"),
+    ("Korean", "ko"),
+    ("Portuguese", "pt"),
+    ("Russian", "ru"),
+    ("Italian", "it"),
+)
+OLLAMA_TASK_CHOICES = (
+    ("Improve Grammar & Punctuation", "improve"),
+    ("Summarize in Bullet Points", "summarize"),
+    ("Translate to Spanish", "translate"),
+)
@@ -14,11 +14,15 @@ if sys.platform == "win32" and getattr(sys, 'frozen', False):
     _k32 = ctypes.windll.kernel32
     _k32.LoadLibraryExW.restype = ctypes.c_void_p
     _k32.LoadLibraryExW.argtypes = [ctypes.c_wchar_p, ctypes.c_void_p, ctypes.c_uint32]
+    _k32.GetModuleHandleW.restype = ctypes.c_void_p
+    _k32.GetModuleHandleW.argtypes = [ctypes.c_wchar_p]
     _sys32 = os.path.join(os.environ.get('SystemRoot', r'C:\Windows'), 'System32')
     _base = sys._MEIPASS
-    # Pre-load system DLLs that onnxruntime needs
+    # Pre-load system DLLs that onnxruntime needs (the runtime hook has usually
+    # loaded them already, so skip any that are mapped into the process)
     for _dep in ['dxgi.dll', 'dbghelp.dll', 'SETUPAPI.dll', 'MSVCP140.dll', 'MSVCP140_1.dll']:
-        _k32.LoadLibraryExW(os.path.join(_sys32, _dep), None, 0)
+        if not _k32.GetModuleHandleW(_dep):
+            _k32.LoadLibraryExW(os.path.join(_sys32, _dep), None, 0)
     # Add DLL search directories
     os.add_dll_directory(_base)
     _ort_capi = os.path.join(_base, "onnxruntime", "capi")
@@ -26,6 +30,8 @@ if sys.platform == "win32" and getattr(sys, 'frozen', False):
         os.add_dll_directory(_ort_capi)
     # Pre-load onnxruntime DLLs with LOAD_WITH_ALTERED_SEARCH_PATH
     for _dll in ['onnxruntime.dll', 'onnxruntime_providers_shared.dll']:
+        if _k32.GetModuleHandleW(_dll):
+            continue
         for _d in [_ort_capi, _base]:
             _p = os.path.join(_d, _dll)
             if os.path.isfile(_p):
@@ -33,12 +39,12 @@ if sys.platform == "win32" and getattr(sys, 'frozen', False):
                 break
 
 try:
-    from .transcription import transcribe_with_google
-    from .audio_processor import process_audio
+    from .transcription import transcribe_with_google_array
+    from .audio_processor import process_audio, peak_amplitude
     from .overlay import FloatingOverlay
 except ImportError:
-    from src.transcription import transcribe_with_google
-    from src.audio_processor import process_audio
+    from src.transcription import transcribe_with_google_array
+    from src.audio_processor import process_audio, peak_amplitude
     from src.overlay import FloatingOverlay
 
 try:
@@ -54,21 +60,234 @@ except (ImportError, FileNotFoundError) as e:
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 import threading
-import pyperclip
-from pynput import keyboard
+import concurrent.futures
+import functools
+import logging
+import types
 import numpy as np
 import sounddevice as sd
 import time
 import json
-import pystray
-from PIL import Image, ImageDraw
+
+# Hot-path diagnostics (audio callbacks, continuous loop). Off by default; WOICE_LOG=debug enables them.
+log = logging.getLogger(__name__)
 
 SETTINGS_FILE = "settings.json"
+MAX_RECORDING_SECONDS = 300  # Capacity of the preallocated manual-recording buffer
+WAKE_SAMPLES = 1600  # Audio callbacks wake the VAD thread every 100ms of captured audio
+VAD_BATCH_FRAMES = 4  # Continuous mode scores at least this many 512-sample VAD frames per pass
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_devices():
+    """Return sd.query_devices() as a tuple, enumerated once per app launch.
+
+    PortAudio only rescans devices when it is re-initialized, so repeated
+    queries return the same list anyway; they just pay for the enumeration.
+    """
+    return tuple(sd.query_devices())
+
+
+# JSON last written to SETTINGS_FILE, used to skip rewriting unchanged settings
+_saved_settings_json = None
+
+
+def _save_settings(settings):
+    """Write settings to SETTINGS_FILE atomically, skipping the write if nothing changed.
+
+    The JSON goes to a temp file that then replaces the original, so a crash
+    mid-write can never leave a truncated settings file behind.
+
+    Raises:
+        OSError: if the file cannot be written
+    """
+    global _saved_settings_json
+    data = json.dumps(settings, indent=2)
+    if data == _saved_settings_json:
+        return
+    tmp_path = SETTINGS_FILE + '.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write(data)
+    os.replace(tmp_path, SETTINGS_FILE)
+    _saved_settings_json = data
+
+
+@functools.lru_cache(maxsize=1)
+def _clipboard_api():
+    """Load user32/kernel32 for clipboard writes, with prototypes declared once.
+
+    Returns:
+        types.SimpleNamespace with user32 and kernel32
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+    kernel32.GlobalAlloc.argtypes = (wintypes.UINT, ctypes.c_size_t)
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalLock.restype = ctypes.c_void_p
+    kernel32.GlobalUnlock.argtypes = (wintypes.HGLOBAL,)
+    kernel32.GlobalFree.argtypes = (wintypes.HGLOBAL,)
+    user32.OpenClipboard.argtypes = (wintypes.HWND,)
+    user32.SetClipboardData.argtypes = (wintypes.UINT, wintypes.HANDLE)
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.GetClipboardData.argtypes = (wintypes.UINT,)
+    user32.GetClipboardData.restype = wintypes.HANDLE
+    user32.IsClipboardFormatAvailable.argtypes = (wintypes.UINT,)
+    user32.IsClipboardFormatAvailable.restype = wintypes.BOOL
+    user32.EnumClipboardFormats.argtypes = (wintypes.UINT,)
+    user32.EnumClipboardFormats.restype = wintypes.UINT
+
+    return types.SimpleNamespace(user32=user32, kernel32=kernel32)
+
+
+def _get_clipboard_text():
+    """Return the clipboard's text, or None if it holds no text (e.g. an image or files).
+
+    Uses CF_UNICODETEXT via user32/kernel32 on Windows, pyperclip elsewhere
+    (where an empty string is taken to mean no text).
+    """
+    import ctypes
+    try:
+        api = _clipboard_api()
+    except (AttributeError, OSError):
+        import pyperclip
+        return pyperclip.paste() or None
+    user32 = api.user32
+    kernel32 = api.kernel32
+
+    CF_UNICODETEXT = 13
+    if not user32.IsClipboardFormatAvailable(CF_UNICODETEXT):
+        return None
+    if not user32.OpenClipboard(None):
+        raise OSError("clipboard is busy")
+    try:
+        handle = user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return None
+        locked = kernel32.GlobalLock(handle)
+        if not locked:
+            return None
+        try:
+            return ctypes.wstring_at(locked)
+        finally:
+            kernel32.GlobalUnlock(handle)
+    finally:
+        user32.CloseClipboard()
+
+
+def _clipboard_is_plain_text():
+    """Return True if the clipboard is empty or holds only plain text.
+
+    Any other format (image, files, HTML, RTF, ...) means a text-only
+    save/restore would lose content. Off Windows the formats can't be
+    inspected, so this returns False.
+    """
+    try:
+        api = _clipboard_api()
+    except (AttributeError, OSError):
+        return False
+    user32 = api.user32
+
+    # CF_TEXT, CF_OEMTEXT, CF_UNICODETEXT and CF_LOCALE (added alongside any text copy)
+    text_formats = {1, 7, 13, 16}
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        fmt = user32.EnumClipboardFormats(0)
+        while fmt:
+            if fmt not in text_formats:
+                return False
+            fmt = user32.EnumClipboardFormats(fmt)
+        return True
+    finally:
+        user32.CloseClipboard()
+
+
+def _set_clipboard_text(text):
+    """Put text on the Windows clipboard as CF_UNICODETEXT via user32/kernel32.
+
+    Returns:
+        bool: True on success, False if not on Windows or the clipboard is busy
+    """
+    import ctypes
+    try:
+        api = _clipboard_api()
+    except (AttributeError, OSError):
+        return False
+    user32 = api.user32
+    kernel32 = api.kernel32
+
+    CF_UNICODETEXT = 13
+    GMEM_MOVEABLE = 0x0002
+
+    buf = ctypes.create_unicode_buffer(text)  # UTF-16 on Windows, NUL-terminated
+    size = ctypes.sizeof(buf)
+
+    if not user32.OpenClipboard(None):
+        return False
+    try:
+        user32.EmptyClipboard()
+        handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, size)
+        if not handle:
+            return False
+        locked = kernel32.GlobalLock(handle)
+        if not locked:
+            kernel32.GlobalFree(handle)
+            return False
+        ctypes.memmove(locked, buf, size)
+        kernel32.GlobalUnlock(handle)
+        if not user32.SetClipboardData(CF_UNICODETEXT, handle):
+            kernel32.GlobalFree(handle)  # Ownership only passes to the system on success
+            return False
+        return True
+    finally:
+        user32.CloseClipboard()
+
+
+@functools.lru_cache(maxsize=1)
+def _post_message_api():
+    """Load user32/kernel32/winmm for Game Mode typing, with prototypes declared once.
+
+    Private WinDLL instances, so the argtypes set here don't affect other callers.
+
+    Returns:
+        types.SimpleNamespace with user32, kernel32 and winmm
+    """
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL('user32', use_last_error=True)
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    winmm = ctypes.WinDLL('winmm')
+
+    user32.PostMessageW.argtypes = (wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM)
+    user32.PostMessageW.restype = wintypes.BOOL
+    user32.GetForegroundWindow.argtypes = ()
+    user32.GetForegroundWindow.restype = wintypes.HWND
+    user32.GetFocus.argtypes = ()
+    user32.GetFocus.restype = wintypes.HWND
+    user32.GetWindowThreadProcessId.argtypes = (wintypes.HWND, wintypes.LPDWORD)
+    user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+    user32.AttachThreadInput.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.BOOL)
+    user32.AttachThreadInput.restype = wintypes.BOOL
+    kernel32.GetCurrentThreadId.argtypes = ()
+    kernel32.GetCurrentThreadId.restype = wintypes.DWORD
+    winmm.timeBeginPeriod.argtypes = (wintypes.UINT,)
+    winmm.timeBeginPeriod.restype = wintypes.UINT
+    winmm.timeEndPeriod.argtypes = (wintypes.UINT,)
+    winmm.timeEndPeriod.restype = wintypes.UINT
+
+    return types.SimpleNamespace(user32=user32, kernel32=kernel32, winmm=winmm)
 
 
 class SettingsDialog:
-    def __init__(self, parent, settings):
+    def __init__(self, parent, settings, on_save=None):
         self.settings = settings
+        self.on_save = on_save  # Called after the settings dict has been updated
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Settings")
         self.dialog.grab_set()
@@ -76,7 +295,7 @@ class SettingsDialog:
 
         # Center dialog on screen
         dialog_width = 450
-        dialog_height = 680
+        dialog_height = 740
         self.dialog.update_idletasks()
         screen_width = self.dialog.winfo_screenwidth()
         screen_height = self.dialog.winfo_screenheight()
@@ -104,13 +323,11 @@ class SettingsDialog:
         mic_frame.pack(pady=10, padx=20, fill=tk.X)
 
         tk.Label(mic_frame, text="Microphone:", font=("Arial", 10, "bold")).pack(anchor='w')
-        mic_devices = SimpleSTTApp._get_input_devices()
-        mic_names = ["auto"] + [name for _, name in mic_devices]
         self.microphone_var = tk.StringVar(value=settings.get('microphone', 'auto'))
         mic_combo = ttk.Combobox(
             mic_frame,
             textvariable=self.microphone_var,
-            values=mic_names,
+            values=SimpleSTTApp._microphone_choices(),
             state="readonly",
             width=40
         )
@@ -126,6 +343,21 @@ class SettingsDialog:
         )
         game_mode_cb.pack(pady=5, padx=20)
 
+        # Normal mode output method
+        paste_frame = tk.Frame(self.dialog)
+        paste_frame.pack(pady=5, padx=20, fill=tk.X)
+
+        tk.Label(paste_frame, text="Output method (when Game Mode is off):", font=("Arial", 10)).pack(anchor='w')
+        self.paste_mode_var = tk.StringVar(value=settings.get('paste_mode', 'keystroke'))
+        paste_combo = ttk.Combobox(
+            paste_frame,
+            textvariable=self.paste_mode_var,
+            values=["keystroke", "clipboard"],
+            state="readonly",
+            width=20
+        )
+        paste_combo.pack(pady=5, fill=tk.X)
+
         # Continuous mode
         self.continuous_var = tk.BooleanVar(value=settings['continuous'])
         continuous_cb = tk.Checkbutton(
@@ -277,6 +509,7 @@ class SettingsDialog:
             self.settings['language'] = self.language_var.get()
             self.settings['microphone'] = self.microphone_var.get()
             self.settings['game_mode'] = self.game_mode_var.get()
+            self.settings['paste_mode'] = self.paste_mode_var.get()
             self.settings['continuous'] = self.continuous_var.get()
             self.settings['pause_threshold'] = pause_threshold
             self.settings['silence_threshold'] = silence_threshold
@@ -288,11 +521,12 @@ class SettingsDialog:
             self.settings['overlay_opacity'] = self.overlay_opacity_var.get()
             self.settings['overlay_position'] = self.overlay_position_var.get()
             self.settings['overlay_max_lines'] = int(self.overlay_max_lines_var.get())
+            if self.on_save:
+                self.on_save()
 
             # Save to file
             try:
-                with open(SETTINGS_FILE, 'w') as f:
-                    json.dump(self.settings, f, indent=2)
+                _save_settings(self.settings)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save settings: {str(e)}")
                 return
@@ -323,33 +557,56 @@ class SimpleSTTApp:
 
         # Load settings from file or use defaults
         self.settings = self._load_settings()
+        self._refresh_cfg()
 
         # State
         self.is_recording = False
-        self.audio_data = []
         self.sample_rate = 16000
+        # Manual recording buffer: the callback writes samples in place, _wpos is the fill level
+        self._buf = np.empty(self.sample_rate * MAX_RECORDING_SECONDS, dtype=np.float32)
+        self._buf_bytes = memoryview(self._buf).cast('B')  # Byte view for raw stream writes
+        # Set by the audio callbacks when new audio is ready (and on stop) to wake the VAD threads
+        self._audio_ready = threading.Event()
+        self._wpos = 0
+        # Persistent input stream for manual recording (opened on first use, then kept running)
+        self._in_stream = None
+        self._in_stream_device = None
+        # (microphone setting, resolved device index) from the last lookup
+        self._mic_device_idx = None
+        # pynput keyboard Controller, created on first paste
+        self._keyboard = None
+        # Clipboard paste: one pending restore of the user's original clipboard text
+        self._clip_lock = threading.Lock()
+        self._clip_timer = None
+        self._clip_generation = 0
+        self._clip_original = None
+        self._clip_pasted = None
         self.continuous_mode = False
         self.continuous_thread = None
+        # Continuous-mode transcriptions; two workers bound concurrent Google SR requests
+        self._transcribe_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="transcribe"
+        )
         # Voice Activity Detection (Silero VAD)
         self.vad = None
         self.vad_available = _vad_available
         if self.vad_available:
             try:
-                self.vad = SileroVAD()
+                self.vad = SileroVAD(backend=self.settings.get('vad_backend', 'cpu'))
                 print("[DEBUG] Silero VAD initialized")
             except Exception as e:
                 self.vad_available = False
                 print(f"[WARNING] Silero VAD init failed: {e}, using amplitude detection")
 
+        # Enumerate audio devices in the background so the first recording doesn't wait on it
+        threading.Thread(target=self._warm_audio_devices, daemon=True).start()
+
         # Overlay window (created lazily on first toggle)
         self.overlay_window = None
 
         # System tray
         self.tray_icon = None
         self.tray_running = False
-        print("[DEBUG] Creating tray icon...")
-        self._create_tray_icon()
-        print("[DEBUG] Tray icon created")
 
         print("[DEBUG] Creating UI...")
         self._create_ui()
@@ -367,7 +624,7 @@ class SimpleSTTApp:
         print("[DEBUG] Hiding window and starting tray icon...")
         self.root.withdraw()
         self.tray_running = True
-        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        threading.Thread(target=self._run_tray, daemon=True).start()
         print("[DEBUG] Tray icon thread started")
 
         # Create overlay (starts hidden, auto-shows when text arrives)
@@ -382,8 +639,10 @@ class SimpleSTTApp:
             'silence_threshold': 0.01,  # Audio amplitude threshold for silence detection
             'game_mode': False,  # Use PostMessage/WM_CHAR instead of SendInput (for games with anti-cheat)
             'game_mode_char_delay': 0.01,  # Delay between characters in game mode (seconds)
+            'paste_mode': 'keystroke',  # Normal mode: 'keystroke' (type each char) or 'clipboard' (Ctrl+V)
             'idle_timeout': 10,  # Auto-stop recording after N seconds of silence (0 = disabled)
             'vad_threshold': 0.5,  # Silero VAD speech probability threshold (0.0-1.0)
+            'vad_backend': 'cpu',  # Silero VAD runtime: 'cpu' or 'openvino' (needs onnxruntime-openvino)
             'overlay_enabled': False,
             'overlay_opacity': 0.90,
             'overlay_width': 400,
@@ -409,6 +668,13 @@ class SimpleSTTApp:
 
         return default_settings
 
+    def _refresh_cfg(self):
+        """Snapshot settings into self.cfg for attribute access on hot paths.
+
+        Must be called whenever self.settings changes.
+        """
+        self.cfg = types.SimpleNamespace(**self.settings)
+
     def _ui_update(self, callback, *args):
         """Schedule a UI update to run on the main thread."""
         self.root.after(0, callback, *args)
@@ -417,23 +683,45 @@ class SimpleSTTApp:
     def _get_input_devices():
         """Get list of physical microphone input devices, filtering out loopback/virtual devices."""
         excluded = ['stereo mix', 'loopback', 'what u hear', 'cable output', 'virtual']
-        devices = sd.query_devices()
         mic_devices = []
-        for i, dev in enumerate(devices):
+        for i, dev in enumerate(_cached_devices()):
             if dev['max_input_channels'] > 0:
                 name = dev['name']
                 if not any(ex in name.lower() for ex in excluded):
                     mic_devices.append((i, name))
         return mic_devices
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _microphone_choices():
+        """Return the Settings dialog microphone choices: 'auto' plus each physical mic name."""
+        return ("auto",) + tuple(name for _, name in SimpleSTTApp._get_input_devices())
+
     def _get_microphone_device(self):
-        """Get the sounddevice device index for the configured microphone."""
+        """Get the sounddevice device index for the configured microphone.
+
+        The resolved index is cached until the 'microphone' setting changes.
+        """
         mic_setting = self.settings.get('microphone', 'auto')
+        if self._mic_device_idx is not None and self._mic_device_idx[0] == mic_setting:
+            return self._mic_device_idx[1]
+
+        device = self._resolve_microphone_device(mic_setting)
+        self._mic_device_idx = (mic_setting, device)
+        return device
+
+    def _warm_audio_devices(self):
+        """Populate the device list and resolved microphone index ahead of first use."""
+        try:
+            self._get_microphone_device()
+        except Exception as e:
+            print(f"[WARNING] Audio device enumeration failed: {e}")
 
+    def _resolve_microphone_device(self, mic_setting):
+        """Map a 'microphone' setting value to a sounddevice device index (or None)."""
         if mic_setting != 'auto':
             # User selected a specific device - find it by name
-            devices = sd.query_devices()
-            for i, dev in enumerate(devices):
+            for i, dev in enumerate(_cached_devices()):
                 if dev['max_input_channels'] > 0 and dev['name'] == mic_setting:
                     return i
 
@@ -451,8 +739,18 @@ class SimpleSTTApp:
             self.overlay_window = FloatingOverlay(self)
             self.overlay_window.create_overlay(self.settings)
 
+    def _run_tray(self):
+        """Tray thread: build the icon (pystray/PIL imported here, off the UI path) and run it."""
+        print("[DEBUG] Creating tray icon...")
+        self._create_tray_icon()
+        print("[DEBUG] Tray icon created")
+        self.tray_icon.run()
+
     def _create_tray_icon(self):
         """Create system tray icon"""
+        import pystray
+        from PIL import Image, ImageDraw
+
         # Create idle icon (green) and recording icon (red)
         self._icon_idle = Image.new('RGB', (64, 64), color='white')
         draw = ImageDraw.Draw(self._icon_idle)
@@ -530,11 +828,11 @@ class SimpleSTTApp:
         """Implementation of toggle game mode (runs in main thread)"""
         current = self.settings.get('game_mode', False)
         self.settings['game_mode'] = not current
+        self._refresh_cfg()
 
         # Save settings
         try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            _save_settings(self.settings)
         except Exception:
             pass  # Ignore save errors
 
@@ -560,11 +858,11 @@ class SimpleSTTApp:
         # Toggle visibility
         self.overlay_window.toggle_visibility()
         self.settings['overlay_enabled'] = self.overlay_window.is_visible
+        self._refresh_cfg()
 
         # Save settings
         try:
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(self.settings, f, indent=2)
+            _save_settings(self.settings)
         except Exception:
             pass  # Ignore save errors
 
@@ -664,6 +962,8 @@ class SimpleSTTApp:
 
     def _setup_hotkeys(self):
         """Setup global hotkeys"""
+        from pynput import keyboard
+
         self.hotkey_listener = keyboard.GlobalHotKeys({
             '<ctrl>+<shift>+<space>': self.toggle_recording
         })
@@ -671,7 +971,7 @@ class SimpleSTTApp:
 
     def open_settings(self):
         """Open settings dialog"""
-        SettingsDialog(self.root, self.settings)
+        SettingsDialog(self.root, self.settings, on_save=self._refresh_cfg)
 
     def _check_voice_activity(self, audio_chunk):
         """Check if audio chunk contains speech using Silero VAD or amplitude fallback.
@@ -683,16 +983,15 @@ class SimpleSTTApp:
             bool: True if speech detected
         """
         if self.vad_available:
-            vad_threshold = self.settings.get('vad_threshold', 0.5)
-            max_prob = 0.0
+            vad_threshold = self.cfg.vad_threshold
             # Process in 512-sample frames (required by Silero VAD)
-            for i in range(0, len(audio_chunk) - 511, 512):
-                frame = audio_chunk[i:i + 512]
-                prob = self.vad.process(frame)
-                max_prob = max(max_prob, prob)
-            return max_prob >= vad_threshold
+            usable = len(audio_chunk) // 512 * 512
+            if not usable:
+                return False
+            frames = audio_chunk[:usable].reshape(-1, 512)
+            return self.vad.process_batch(frames).max() >= vad_threshold
         else:
-            return np.max(np.abs(audio_chunk)) >= self.settings['silence_threshold']
+            return peak_amplitude(audio_chunk) >= self.cfg.silence_threshold
 
     def _update_tray(self):
         """Refresh tray icon and menu state."""
@@ -727,61 +1026,110 @@ class SimpleSTTApp:
 
     def start_recording(self):
         """Start manual recording"""
-        print("[DEBUG] start_recording() called")
+        log.debug("start_recording() called")
         if self.continuous_mode:
-            print("[DEBUG] Already in continuous mode, skipping")
+            log.debug("Already in continuous mode, skipping")
             return
 
+        self._wpos = 0
+        self._audio_ready.clear()
         self.is_recording = True
-        self.audio_data = []
         self.start_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
         self.status_var.set("🎤 Recording... Speak now!")
-        print("[DEBUG] Recording started, is_recording=True")
+        log.debug("Recording started, is_recording=True")
 
         threading.Thread(target=self._record_audio, daemon=True).start()
 
+    def _audio_cb(self, indata, frames, time, status):
+        """Raw input stream callback: only keeps samples while a manual recording is active.
+
+        indata is a buffer of float32 mono bytes; it is copied straight into the
+        recording buffer without creating any NumPy arrays on the audio thread.
+        """
+        if status:
+            log.debug("Audio callback status: %s", status)
+        if self.is_recording:
+            wpos = self._wpos
+            n = min(frames, len(self._buf) - wpos)
+            if n > 0:
+                self._buf_bytes[wpos * 4:(wpos + n) * 4] = memoryview(indata)[:n * 4]
+                self._wpos = wpos + n
+            if n < frames or wpos // WAKE_SAMPLES != (wpos + n) // WAKE_SAMPLES:
+                self._audio_ready.set()
+
+    def _ensure_input_stream(self):
+        """Open the persistent input stream, or reopen it if the device changed or it died.
+
+        Opening a PortAudio stream is slow, so it is kept running between recordings
+        and the callback simply ignores samples while is_recording is False.
+        """
+        mic_device = self._get_microphone_device()
+        stream = self._in_stream
+        if stream is not None and stream.active and self._in_stream_device == mic_device:
+            return
+        self._close_input_stream()
+        log.debug("Opening audio stream (sample_rate=%s, device=%s)", self.sample_rate, mic_device)
+        stream = sd.RawInputStream(
+            samplerate=self.sample_rate,
+            channels=1,
+            dtype='float32',
+            device=mic_device,
+            blocksize=512,
+            latency='low',
+            callback=self._audio_cb
+        )
+        stream.start()
+        self._in_stream = stream
+        self._in_stream_device = mic_device
+
+    def _close_input_stream(self):
+        """Stop and close the persistent input stream, if open."""
+        stream, self._in_stream = self._in_stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception as e:
+                log.warning("Error closing audio stream: %s", e)
+            log.debug("Audio stream closed")
+
     def _record_audio(self):
-        """Record audio from microphone"""
-        print("[DEBUG] _record_audio() thread started")
-        idle_timeout = self.settings.get('idle_timeout', 10)
-        silence_threshold = self.settings['silence_threshold']
+        """Watch a manual recording for idle timeout (samples arrive via _audio_cb)"""
+        log.debug("_record_audio() thread started")
+        idle_timeout = self.cfg.idle_timeout
         idle_duration = 0.0
-        check_interval = 0.1  # 100ms
-
-        def callback(indata, frames, time, status):
-            if status:
-                print(f"[DEBUG] Audio callback status: {status}")
-            if self.is_recording:
-                self.audio_data.append(indata.copy())
+        vad_cursor = 0  # Buffer position up to which audio has already been through VAD
 
         try:
-            mic_device = self._get_microphone_device()
-            print(f"[DEBUG] Opening audio stream (sample_rate={self.sample_rate}, device={mic_device})")
-            with sd.InputStream(
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype=np.float32,
-                device=mic_device,
-                callback=callback
-            ):
-                print("[DEBUG] Audio stream opened, recording...")
-                while self.is_recording:
-                    sd.sleep(int(check_interval * 1000))
-                    # Idle auto-stop for manual recording
-                    if idle_timeout > 0 and self.audio_data:
-                        latest = self.audio_data[-1].flatten()
-                        if self._check_voice_activity(latest):
-                            idle_duration = 0.0
-                        else:
-                            idle_duration += check_interval
-                            if idle_duration >= idle_timeout:
-                                print(f"[DEBUG] Manual recording idle timeout ({idle_duration:.1f}s), auto-stopping...")
-                                self._ui_update(self.stop_recording)
-                                break
-            print("[DEBUG] Audio stream closed")
+            self._ensure_input_stream()
+            if self.vad_available:
+                self.vad.reset_states()
+            log.debug("Audio stream running, recording...")
+            while self.is_recording:
+                # Woken by _audio_cb every ~100ms of audio (timeout only guards a stalled device)
+                if not self._audio_ready.wait(timeout=1.0):
+                    continue
+                self._audio_ready.clear()
+                # Idle auto-stop for manual recording
+                if self._wpos >= len(self._buf):
+                    log.debug("Recording buffer full (%ss), auto-stopping...", MAX_RECORDING_SECONDS)
+                    self._ui_update(self.stop_recording)
+                    break
+                # Only score whole 512-sample frames that arrived since the last check
+                frame_end = self._wpos // 512 * 512
+                if idle_timeout > 0 and frame_end - vad_cursor >= 512:
+                    new_audio = self._buf[vad_cursor:frame_end]
+                    vad_cursor = frame_end
+                    if self._check_voice_activity(new_audio):
+                        idle_duration = 0.0
+                    else:
+                        idle_duration += len(new_audio) / self.sample_rate
+                        if idle_duration >= idle_timeout:
+                            log.debug("Manual recording idle timeout (%.1fs), auto-stopping...", idle_duration)
+                            self._ui_update(self.stop_recording)
+                            break
         except Exception as e:
-            print(f"[DEBUG] ERROR in _record_audio: {e}")
+            log.exception("Error in _record_audio: %s", e)
 
     def stop_recording(self):
         """Stop recording and transcribe"""
@@ -789,6 +1137,7 @@ class SimpleSTTApp:
             return
 
         self.is_recording = False
+        self._audio_ready.set()  # Let the watcher thread exit now
         self.start_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
         self.status_var.set("Processing...")
@@ -797,46 +1146,38 @@ class SimpleSTTApp:
 
     def _process_audio(self):
         """Process and transcribe recorded audio"""
-        print("[DEBUG] _process_audio() called")
+        log.debug("_process_audio() called")
         try:
-            if not self.audio_data:
-                print("[DEBUG] No audio data to process")
+            if not self._wpos:
+                log.debug("No audio data to process")
                 self._ui_update(self.status_var.set, "No audio recorded")
                 return
 
-            print(f"[DEBUG] Audio chunks captured: {len(self.audio_data)}")
-
-            # Combine audio chunks
-            audio_array = np.concatenate(self.audio_data, axis=0).flatten()
-            print(f"[DEBUG] Combined audio size: {len(audio_array)} samples")
+            # Copy out the recorded span (the buffer is reused by the next recording)
+            audio_array = self._buf[:self._wpos].copy()
+            log.debug("Recorded audio size: %s samples", len(audio_array))
 
             # Process audio
-            print("[DEBUG] Processing audio...")
-            temp_path, duration, _ = process_audio(audio_array, self.sample_rate)
-            print(f"[DEBUG] Audio processed, duration={duration:.2f}s, temp_path={temp_path}")
+            log.debug("Processing audio...")
+            audio_array, duration, _ = process_audio(audio_array, self.sample_rate)
+            log.debug("Audio processed, duration=%.2fs", duration)
 
             # Transcribe
             self._ui_update(self.status_var.set, "Transcribing...")
-            language = self.settings['language'] if self.settings['language'] != "auto" else None
-            print(f"[DEBUG] Transcribing with language={language}...")
-            result = transcribe_with_google(temp_path, language)
+            language = self.cfg.language if self.cfg.language != "auto" else None
+            log.debug("Transcribing with language=%s...", language)
+            result = transcribe_with_google_array(audio_array, self.sample_rate, language)
             transcription = result["text"]
-            print(f"[DEBUG] Transcription result: '{transcription}'")
-
-            # Clean up
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
+            log.debug("Transcription result: '%s'", transcription)
 
             # Update UI on main thread
             def update_ui():
-                print("[DEBUG] Updating UI with transcription...")
+                log.debug("Updating UI with transcription...")
                 self.output_text.insert(tk.END, transcription + "\n")
                 self.output_text.see(tk.END)
 
                 # Paste BEFORE overlay update (overlay show can affect focus)
-                print("[DEBUG] Auto-pasting...")
+                log.debug("Auto-pasting...")
                 self.paste_to_active_window(transcription)
                 self.status_var.set(f"Transcribed and pasted! ({duration:.1f}s)")
 
@@ -845,44 +1186,44 @@ class SimpleSTTApp:
                     self.overlay_window.update_text(transcription + "\n")
 
             self._ui_update(update_ui)
-            print("[DEBUG] _process_audio() completed successfully")
+            log.debug("_process_audio() completed successfully")
 
         except Exception as e:
-            print(f"[DEBUG] ERROR in _process_audio: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in _process_audio: %s", e)
             self._ui_update(self.status_var.set, f"Error: {str(e)}")
 
     def start_continuous_mode(self):
         """Start continuous transcription"""
-        print("[DEBUG] start_continuous_mode() called")
+        log.debug("start_continuous_mode() called")
         if self.continuous_mode:
-            print("[DEBUG] Already in continuous mode")
+            log.debug("Already in continuous mode")
             return
 
+        self._audio_ready.clear()
         self.continuous_mode = True
         self.start_btn.config(state='disabled')
         self.stop_btn.config(state='normal')
         self.status_var.set("🔴 LIVE - Continuous transcription active...")
-        print("[DEBUG] Continuous mode enabled, starting thread...")
+        log.debug("Continuous mode enabled, starting thread...")
 
         self.continuous_thread = threading.Thread(
             target=self._continuous_loop,
             daemon=True
         )
         self.continuous_thread.start()
-        print("[DEBUG] Continuous thread started")
+        log.debug("Continuous thread started")
 
     def stop_continuous_mode(self):
         """Stop continuous transcription"""
         self.continuous_mode = False
+        self._audio_ready.set()  # Let the loop flush and exit now
         self.start_btn.config(state='normal')
         self.stop_btn.config(state='disabled')
         self.status_var.set("Continuous mode stopped")
 
     def _continuous_loop(self):
         """Continuous recording loop with Voice Activity Detection"""
-        print("[DEBUG] _continuous_loop() started")
+        log.debug("_continuous_loop() started")
         # Reset VAD hidden state for a fresh stream
         if self.vad_available:
             self.vad.reset_states()
@@ -890,80 +1231,126 @@ class SimpleSTTApp:
         silence_threshold = self.settings['silence_threshold']
         idle_timeout = self.settings.get('idle_timeout', 10)
         vad_mode = "Silero VAD" if self.vad_available else "amplitude"
-        print(f"[DEBUG] Continuous settings: pause={pause_threshold}s, silence={silence_threshold}, idle_timeout={idle_timeout}s, detection={vad_mode}")
-
-        audio_buffer = []  # Accumulates audio while speaking
-        silence_buffer = []  # Accumulates audio during silence
-        silence_duration = 0.0
+        # Per-iteration attribute lookups bound to locals once
+        sample_rate = self.sample_rate
+        audio_ready = self._audio_ready
+        check_voice = self._check_voice_activity
+        submit = self._transcribe_pool.submit
+        process_chunk = self._process_continuous_chunk
+        log.debug("Continuous settings: pause=%ss, silence=%s, idle_timeout=%ss, detection=%s", pause_threshold, silence_threshold, idle_timeout, vad_mode)
+
+        # Capture ring: the callback copies samples in, this thread drains [read_idx, write_idx)
+        ring = np.empty(sample_rate * 5, dtype=np.float32)
+        ring_bytes = memoryview(ring).cast('B')
+        ring_size = len(ring)
+        ring_headroom = sample_rate  # 1s the callback can write while a drained span is in use
+        max_backlog = ring_size - ring_headroom  # Unread samples kept before older ones are dropped
+        write_idx = 0  # Total samples written by the callback (monotonic)
+        read_idx = 0  # Total samples consumed by this loop
+        # Current utterance (speech plus trailing silence), written in place up to speech_len.
+        # Sized for the forced 30s flush plus a full pause and two 5s ring drains of overshoot.
+        max_buffer_duration = 30.0  # Force process after 30 seconds of continuous speech
+        speech_buf = np.empty(int((max_buffer_duration + pause_threshold + 10) * sample_rate), dtype=np.float32)
+        speech_len = 0
+        silence_samples = 0  # Silence accumulated in speech_buf since speech started
         is_speaking = False
-        chunk_duration = 0.1  # Process in 100ms chunks
         loop_count = 0
         idle_duration = 0.0  # Time since last voice activity
 
         def audio_callback(indata, frames, time_info, status):
+            nonlocal write_idx
             if status:
-                print(f"[DEBUG] Continuous audio callback status: {status}")
+                log.debug("Continuous audio callback status: %s", status)
             if self.continuous_mode:
-                audio_buffer.append(indata.copy())
+                # Raw float32 bytes straight into the ring, split at the wrap point
+                src = memoryview(indata)
+                pos = write_idx % ring_size
+                first = min(frames, ring_size - pos)
+                ring_bytes[pos * 4:(pos + first) * 4] = src[:first * 4]
+                ring_bytes[:(frames - first) * 4] = src[first * 4:frames * 4]
+                wake = write_idx // WAKE_SAMPLES != (write_idx + frames) // WAKE_SAMPLES
+                write_idx += frames
+                if wake:
+                    audio_ready.set()
 
         try:
             mic_device = self._get_microphone_device()
-            print(f"[DEBUG] Opening continuous audio stream (device={mic_device})...")
-            with sd.InputStream(
-                samplerate=self.sample_rate,
+            log.debug("Opening continuous audio stream (device=%s)...", mic_device)
+            # Same low-latency, VAD-frame-sized blocks as the manual recording stream
+            with sd.RawInputStream(
+                samplerate=sample_rate,
                 channels=1,
-                dtype=np.float32,
+                dtype='float32',
                 device=mic_device,
+                blocksize=512,
+                latency='low',
                 callback=audio_callback
             ):
-                print("[DEBUG] Continuous audio stream opened, entering main loop...")
+                log.debug("Continuous audio stream opened, entering main loop...")
                 while self.continuous_mode:
                     loop_count += 1
                     if loop_count % 50 == 0:  # Print every 5 seconds
-                        print(f"[DEBUG] Continuous loop running... (iteration {loop_count})")
-                    time.sleep(chunk_duration)
-
-                    if not audio_buffer:
+                        log.debug("Continuous loop running... (iteration %d)", loop_count)
+                    # Woken by the callback every ~100ms of audio (timeout only guards a stalled device)
+                    if not audio_ready.wait(timeout=1.0):
+                        continue
+                    audio_ready.clear()
+
+                    end = write_idx
+                    overrun = end - read_idx > max_backlog
+                    if overrun:
+                        # Skip ahead, leaving ring_headroom free slots so the callback's
+                        # next writes land outside the span drained below
+                        log.debug("Continuous ring overrun, dropped %d samples", end - read_idx - max_backlog)
+                        read_idx = end - max_backlog
+                    # Drain whole VAD frames only, and only once a batch is ready; the
+                    # remainder stays in the ring so frames stay aligned across passes
+                    n = (end - read_idx) // 512 * 512
+                    if n < VAD_BATCH_FRAMES * 512:
                         continue
 
-                    # Get latest audio chunk
-                    chunk = np.concatenate(audio_buffer, axis=0).flatten()
-                    audio_buffer.clear()
+                    # Get latest audio chunk: a view into the ring, or a copy when it wraps.
+                    # After an overrun the loop has been stalled, so copy rather than trust the headroom.
+                    pos = read_idx % ring_size
+                    if pos + n <= ring_size:
+                        chunk = ring[pos:pos + n]
+                        if overrun:
+                            chunk = chunk.copy()
+                    else:
+                        chunk = np.concatenate((ring[pos:], ring[:pos + n - ring_size]))
+                    read_idx += n
+                    chunk_duration = n / sample_rate
 
                     # Check if chunk contains voice (Silero VAD or amplitude fallback)
-                    is_voice = self._check_voice_activity(chunk)
+                    is_voice = check_voice(chunk)
 
                     if is_voice:
                         # Voice detected — reset idle timer
                         idle_duration = 0.0
                         if not is_speaking:
                             # Start of new speech
-                            print(f"[DEBUG] Voice detected! (detection={vad_mode})")
+                            log.debug("Voice detected! (detection=%s)", vad_mode)
                             is_speaking = True
-                            silence_buffer = []
-                            silence_duration = 0.0
+                            speech_len = 0
+                            silence_samples = 0
 
                         # Add to speech buffer
-                        silence_buffer.extend(chunk)
+                        speech_buf[speech_len:speech_len + n] = chunk
+                        speech_len += n
 
                         # Check if buffer is getting too large (prevent memory issues and force processing)
-                        buffer_duration = len(silence_buffer) / self.sample_rate
-                        max_buffer_duration = 30.0  # Force process after 30 seconds of continuous speech
+                        buffer_duration = speech_len / sample_rate
 
                         if buffer_duration >= max_buffer_duration:
-                            print(f"[DEBUG] Buffer reached max duration ({buffer_duration:.2f}s), forcing process...")
+                            log.debug("Buffer reached max duration (%.2fs), forcing process...", buffer_duration)
                             # Force process even without pause
-                            speech_audio = np.array(silence_buffer, dtype=np.float32)
+                            speech_audio = speech_buf[:speech_len].copy()
 
-                            threading.Thread(
-                                target=self._process_continuous_chunk,
-                                args=(speech_audio,),
-                                daemon=True
-                            ).start()
+                            submit(process_chunk, speech_audio)
 
                             # Reset buffer but keep speaking state
-                            silence_buffer = []
-                            silence_duration = 0.0
+                            speech_len = 0
+                            silence_samples = 0
 
                     else:
                         # Silence detected
@@ -971,86 +1358,73 @@ class SimpleSTTApp:
                             # Not speaking — accumulate idle time
                             idle_duration += chunk_duration
                             if idle_timeout > 0 and idle_duration >= idle_timeout:
-                                print(f"[DEBUG] Idle timeout reached ({idle_duration:.1f}s >= {idle_timeout}s), auto-stopping...")
+                                log.debug("Idle timeout reached (%.1fs >= %ss), auto-stopping...", idle_duration, idle_timeout)
                                 self._ui_update(self.stop)
                                 break
 
                         if is_speaking:
-                            print(f"[DEBUG] Silence detected while speaking, duration={silence_duration:.2f}s")
                             # Continue accumulating silence
-                            silence_buffer.extend(chunk)
-                            silence_duration += chunk_duration
+                            speech_buf[speech_len:speech_len + n] = chunk
+                            speech_len += n
+                            silence_samples += n
+                            silence_duration = silence_samples / sample_rate
+                            log.debug("Silence detected while speaking, duration=%.2fs", silence_duration)
 
                             # Check if pause threshold exceeded
                             if silence_duration >= pause_threshold:
                                 # Check if actual voice content is long enough
-                                total_duration = len(silence_buffer) / self.sample_rate
+                                total_duration = speech_len / sample_rate
                                 voice_duration = total_duration - silence_duration
 
                                 if voice_duration < 0.5:
-                                    print(f"[DEBUG] SKIPPED - voice too short ({voice_duration:.2f}s), likely noise")
-                                elif len(silence_buffer) > 0:
-                                    speech_audio = np.array(silence_buffer, dtype=np.float32)
+                                    log.debug("SKIPPED - voice too short (%.2fs), likely noise", voice_duration)
+                                elif speech_len > 0:
+                                    speech_audio = speech_buf[:speech_len].copy()
 
-                                    print(f"[DEBUG] Processing audio chunk: {len(speech_audio)} samples, {total_duration:.2f}s (voice: {voice_duration:.2f}s)")
+                                    log.debug("Processing audio chunk: %d samples, %.2fs (voice: %.2fs)", len(speech_audio), total_duration, voice_duration)
 
-                                    threading.Thread(
-                                        target=self._process_continuous_chunk,
-                                        args=(speech_audio,),
-                                        daemon=True
-                                    ).start()
+                                    submit(process_chunk, speech_audio)
 
                                 # Reset for next speech segment
-                                silence_buffer = []
-                                silence_duration = 0.0
+                                speech_len = 0
+                                silence_samples = 0
                                 is_speaking = False
                                 idle_duration = 0.0
 
                 # Flush remaining audio buffer when stopping
-                if is_speaking and len(silence_buffer) > 0:
-                    speech_audio = np.array(silence_buffer, dtype=np.float32)
-                    total_duration = len(speech_audio) / self.sample_rate
-                    voice_duration = total_duration - silence_duration
+                if is_speaking and speech_len > 0:
+                    speech_audio = speech_buf[:speech_len].copy()
+                    total_duration = speech_len / sample_rate
+                    voice_duration = total_duration - silence_samples / sample_rate
                     if voice_duration < 0.5:
-                        print(f"[DEBUG] Flush SKIPPED - voice too short ({voice_duration:.2f}s), likely noise")
+                        log.debug("Flush SKIPPED - voice too short (%.2fs), likely noise", voice_duration)
                     elif total_duration >= 0.3:
-                        print(f"[DEBUG] Flushing remaining buffer: {len(speech_audio)} samples, {total_duration:.2f}s (voice: {voice_duration:.2f}s)")
-                        threading.Thread(
-                            target=self._process_continuous_chunk,
-                            args=(speech_audio,),
-                            daemon=True
-                        ).start()
+                        log.debug("Flushing remaining buffer: %d samples, %.2fs (voice: %.2fs)", len(speech_audio), total_duration, voice_duration)
+                        submit(process_chunk, speech_audio)
 
         except Exception as e:
-            print(f"[DEBUG] ERROR in _continuous_loop: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in _continuous_loop: %s", e)
             self._ui_update(self.status_var.set, f"Error: {str(e)}")
             self.continuous_mode = False
 
-        print("[DEBUG] _continuous_loop() ended")
+        log.debug("_continuous_loop() ended")
 
     def _process_continuous_chunk(self, audio_data):
         """Process continuous audio chunk"""
         try:
-            print(f"[DEBUG] _process_continuous_chunk called with {len(audio_data)} samples")
+            log.debug("_process_continuous_chunk called with %s samples", len(audio_data))
 
-            temp_path, _, _ = process_audio(audio_data, self.sample_rate)
+            audio_data, _, _ = process_audio(audio_data, self.sample_rate)
 
-            language = self.settings['language'] if self.settings['language'] != "auto" else None
-            print(f"[DEBUG] Sending to Google SR...")
-            result = transcribe_with_google(temp_path, language)
+            language = self.cfg.language if self.cfg.language != "auto" else None
+            log.debug("Sending to Google SR...")
+            result = transcribe_with_google_array(audio_data, self.sample_rate, language)
             transcription = result["text"]
-            print(f"[DEBUG] Got transcription: '{transcription}'")
-
-            try:
-                os.unlink(temp_path)
-            except Exception:
-                pass
+            log.debug("Got transcription: '%s'", transcription)
 
             if transcription.strip():
                 def update_ui():
-                    print(f"[DEBUG] Inserting: '{transcription}'")
+                    log.debug("Inserting: '%s'", transcription)
                     self.output_text.insert(tk.END, transcription + " ")
                     self.output_text.see(tk.END)
 
@@ -1064,35 +1438,123 @@ class SimpleSTTApp:
                 self._ui_update(update_ui)
 
         except ValueError as e:
-            print(f"[DEBUG] ValueError: {e}")
+            log.debug("Skipped continuous chunk: %s", e)
         except Exception as e:
-            print(f"[DEBUG] Exception: {e}")
+            log.warning("Continuous transcription failed: %s", e)
 
     def paste_to_active_window(self, text):
         """Type text to active window.
 
         Game Mode: uses PostMessage/WM_CHAR to bypass anti-cheat detection.
-        Normal Mode: uses pynput (SendInput) for maximum compatibility.
+        Normal Mode: types each character with pynput (SendInput), or pastes via
+        clipboard + Ctrl+V when paste_mode is 'clipboard' and the clipboard holds
+        only plain text.
         """
-        if self.settings.get('game_mode', False):
+        if self.cfg.game_mode:
             # Game Mode: use PostMessage to bypass anti-cheat (like Win+H voice typing)
-            print(f"[DEBUG] Game Mode: typing via PostMessage/WM_CHAR")
+            log.debug("Game Mode: typing via PostMessage/WM_CHAR")
             try:
                 time.sleep(0.05)  # Brief delay to ensure window focus
                 success = self._post_message_type(text)
                 if not success:
-                    print(f"[DEBUG] PostMessage typing failed - no foreground window")
+                    log.warning("PostMessage typing failed - no foreground window")
+            except Exception as e:
+                log.warning("Failed to type text via PostMessage: %s", e)
+        elif self.cfg.paste_mode == 'clipboard':
+            # Normal mode: put text on the clipboard and send one Ctrl+V
+            try:
+                time.sleep(0.05)  # Brief delay to ensure window focus
+                if not self._paste_via_clipboard(text):
+                    # Clipboard holds an image, files or rich text: type instead of overwriting it
+                    log.debug("Clipboard holds non-text content, typing instead")
+                    self._keyboard_controller().type(text)
             except Exception as e:
-                print(f"[DEBUG] Failed to type text via PostMessage: {e}")
+                log.warning("Failed to paste text: %s", e)
         else:
-            # Normal mode: use pynput (SendInput) for best compatibility
+            # Keystroke mode: use pynput (SendInput) to type each character
             try:
-                from pynput.keyboard import Controller
-                keyboard_controller = Controller()
                 time.sleep(0.05)  # Brief delay to ensure window focus
-                keyboard_controller.type(text)
+                self._keyboard_controller().type(text)
+            except Exception as e:
+                log.warning("Failed to type text: %s", e)
+
+    def _keyboard_controller(self):
+        """Return the shared pynput keyboard Controller, creating it on first use."""
+        if self._keyboard is None:
+            from pynput.keyboard import Controller
+            self._keyboard = Controller()
+        return self._keyboard
+
+    def _paste_via_clipboard(self, text):
+        """Paste text with a single Ctrl+V, restoring the user's clipboard text afterwards.
+
+        Back-to-back pastes share one pending restore, so the clipboard content
+        from before the first paste is what gets put back.
+
+        Returns:
+            bool: False (nothing pasted) if the clipboard holds anything besides
+            plain text, which a text-only restore would destroy
+        """
+        import pyperclip
+        from pynput.keyboard import Key
+
+        with self._clip_lock:
+            self._clip_generation += 1  # Invalidates a restore that is pending or already firing
+            reuse = False
+            if self._clip_timer is not None:
+                self._clip_timer.cancel()
+                self._clip_timer = None
+                # Still holding our last paste: keep the saved original and push its restore back
+                try:
+                    reuse = _get_clipboard_text() == self._clip_pasted
+                except Exception:
+                    reuse = False
+            if not reuse:
+                self._clip_original = None
+                if not _clipboard_is_plain_text():
+                    return False
+                try:
+                    self._clip_original = _get_clipboard_text()
+                except Exception:
+                    pass  # Locked clipboard: nothing to restore
+
+            if not _set_clipboard_text(text):
+                pyperclip.copy(text)
+            self._clip_pasted = text
+
+        keyboard_controller = self._keyboard_controller()
+        with keyboard_controller.pressed(Key.ctrl):
+            keyboard_controller.press('v')
+            keyboard_controller.release('v')
+
+        with self._clip_lock:
+            if self._clip_original is not None:
+                # Give the target app time to read the clipboard before putting the old text back
+                self._clip_timer = threading.Timer(
+                    0.2, self._restore_clipboard, args=(self._clip_generation,)
+                )
+                self._clip_timer.start()
+        return True
+
+    def _restore_clipboard(self, generation):
+        """Put the user's previous clipboard text back after a paste.
+
+        Skipped if a newer paste has started, or if the clipboard no longer
+        holds the pasted text (the user copied something else meanwhile).
+        """
+        with self._clip_lock:
+            if generation != self._clip_generation:
+                return
+            self._clip_timer = None
+            previous, self._clip_original = self._clip_original, None
+            try:
+                if _get_clipboard_text() != self._clip_pasted:
+                    return
+                if not _set_clipboard_text(previous):
+                    import pyperclip
+                    pyperclip.copy(previous)
             except Exception as e:
-                print(f"[DEBUG] Failed to type text: {e}")
+                log.warning("Failed to restore clipboard: %s", e)
 
     def _post_message_type(self, text):
         """Type text using PostMessage/WM_CHAR (bypasses SendInput detection).
@@ -1104,10 +1566,9 @@ class SimpleSTTApp:
         Uses AttachThreadInput + GetFocus to find the actual focused child
         control (e.g. a game's chat input box) rather than the top-level window.
         """
-        import ctypes
-
-        user32 = ctypes.windll.user32
-        kernel32 = ctypes.windll.kernel32
+        api = _post_message_api()
+        user32 = api.user32
+        kernel32 = api.kernel32
 
         WM_CHAR = 0x0102
         WM_KEYDOWN = 0x0100
@@ -1132,29 +1593,50 @@ class SimpleSTTApp:
             focused = user32.GetFocus()
             if focused:
                 hwnd = focused
-                print(f"[DEBUG] PostMessage: using focused child window {hwnd}")
+                log.debug("PostMessage: using focused child window %s", hwnd)
             else:
-                print(f"[DEBUG] PostMessage: using foreground window {hwnd}")
+                log.debug("PostMessage: using foreground window %s", hwnd)
         finally:
             if attached:
                 user32.AttachThreadInput(current_tid, target_tid, False)
 
         # Send characters to the focused control
-        char_delay = self.settings.get('game_mode_char_delay', 0.01)
-
-        for char in text:
-            if char in ('\n', '\r'):
-                # Enter key: send WM_KEYDOWN + WM_KEYUP for VK_RETURN
-                lparam_down = 1 | (0x1C << 16)
-                lparam_up = 1 | (0x1C << 16) | (1 << 30) | (1 << 31)
-                user32.PostMessageW(hwnd, WM_KEYDOWN, VK_RETURN, lparam_down)
-                time.sleep(char_delay)
-                user32.PostMessageW(hwnd, WM_KEYUP, VK_RETURN, lparam_up)
-            else:
+        char_delay = self.cfg.game_mode_char_delay
+        post = user32.PostMessageW
+        lparam_down = 1 | (0x1C << 16)
+        lparam_up = 1 | (0x1C << 16) | (1 << 30) | (1 << 31)
+
+        # Each '\r' or '\n' becomes one Enter keypress, sent between the line segments
+        lines = text.replace('\r', '\n').split('\n')
+
+        if char_delay <= 0:
+            # No pacing requested: PostMessageW doesn't block, so post everything back-to-back
+            for i, line in enumerate(lines):
+                if i:
+                    post(hwnd, WM_KEYDOWN, VK_RETURN, lparam_down)
+                    post(hwnd, WM_KEYUP, VK_RETURN, lparam_up)
+                for code in map(ord, line):
+                    post(hwnd, WM_CHAR, code, 0)
+            return True
+
+        # Raise the system timer resolution to 1ms so each sleep lasts char_delay,
+        # not the default ~15.6ms tick
+        winmm = api.winmm
+        winmm.timeBeginPeriod(1)
+        try:
+            for i, line in enumerate(lines):
+                if i:
+                    # Enter key: send WM_KEYDOWN + WM_KEYUP for VK_RETURN
+                    post(hwnd, WM_KEYDOWN, VK_RETURN, lparam_down)
+                    time.sleep(char_delay)
+                    post(hwnd, WM_KEYUP, VK_RETURN, lparam_up)
+                    time.sleep(char_delay)
                 # All characters including Unicode/CJK: send WM_CHAR
-                user32.PostMessageW(hwnd, WM_CHAR, ord(char), 0)
-
-            time.sleep(char_delay)
+                for code in map(ord, line):
+                    post(hwnd, WM_CHAR, code, 0)
+                    time.sleep(char_delay)
+        finally:
+            winmm.timeEndPeriod(1)
 
         return True
 
@@ -1162,7 +1644,9 @@ class SimpleSTTApp:
         """Copy text to clipboard"""
         text = self.output_text.get(1.0, tk.END).strip()
         if text:
-            pyperclip.copy(text)
+            if not _set_clipboard_text(text):
+                import pyperclip
+                pyperclip.copy(text)
             self.status_var.set("✓ Copied to clipboard!")
         else:
             self.status_var.set("Nothing to copy")
@@ -1188,6 +1672,8 @@ class SimpleSTTApp:
         """Cleanup on close"""
         self.is_recording = False
         self.continuous_mode = False
+        self._close_input_stream()
+        self._transcribe_pool.shutdown(wait=False, cancel_futures=True)
         if hasattr(self, 'hotkey_listener'):
             self.hotkey_listener.stop()
         if self.tray_icon:
@@ -1221,6 +1707,10 @@ def _acquire_single_instance_lock():
 
 
 def main():
+    # Level applies to this app's logger only; third-party loggers stay at the root's WARNING
+    logging.basicConfig(format='[%(levelname)s] %(message)s')
+    log.setLevel(getattr(logging, os.environ.get('WOICE_LOG', 'warning').upper(), logging.WARNING))
+
     mutex = _acquire_single_instance_lock()
     if mutex is None:
         # Another instance is already running
@@ -3,10 +3,26 @@ Floating overlay window for displaying live transcription text.
 Frameless, borderless, dynamic height. Shows on demand and auto-hides.
 """
 
+import collections
+import threading
+import time
 import tkinter as tk
 import tkinter.font as tkfont
 
 
+def _get_work_area(root):
+    """Return the desktop work area (screen minus taskbar) as (left, top, right, bottom)."""
+    try:
+        import ctypes
+        from ctypes import wintypes
+        rect = wintypes.RECT()
+        if not ctypes.windll.user32.SystemParametersInfoW(0x0030, 0, ctypes.byref(rect), 0):
+            raise OSError("SPI_GETWORKAREA failed")
+        return (rect.left, rect.top, rect.right, rect.bottom)
+    except Exception:
+        return (0, 0, root.winfo_screenwidth(), root.winfo_screenheight() - 48)
+
+
 class FloatingOverlay:
     """
     Manages a floating, always-on-top, frameless overlay window
@@ -24,8 +40,22 @@ class FloatingOverlay:
         self.width = 400
         self.position = 'bottom-right'
         self.font_size = 11
-        self._hide_timer = None
+        self._hide_timer = None  # The single in-flight auto-hide check, if any
+        self._hide_deadline = 0.0  # time.monotonic() at which the overlay auto-hides
         self._font = None
+        self._line_height = 0
+        self._padding = 16  # Text widget top + bottom pady
+        self._last_height = None  # Height last applied via geometry()
+        self._geom_prefix = ''  # Cached f'{width}x'
+        self._anchor_suffix = ''  # Cached f'+{anchor_x}+'
+        self._hwnd = None
+        # Completed lines currently shown, plus the trailing partial line
+        self._lines = collections.deque(maxlen=self.max_lines - 1)
+        self._current_line = ''
+        # Text queued by update_text() until the next coalesced redraw
+        self._pending_text = []
+        self._redraw_scheduled = False
+        self._pending_lock = threading.Lock()
         # Cached bottom-right anchor point (set once during positioning)
         self._anchor_x = 0
         self._anchor_y = 0
@@ -41,6 +71,8 @@ class FloatingOverlay:
         self.position = settings.get('overlay_position', 'bottom-right')
         self.max_lines = settings.get('overlay_max_lines', 10)
         self.font_size = settings.get('overlay_font_size', 11)
+        # The partial line counts toward max_lines, so keep max_lines - 1 completed ones
+        self._lines = collections.deque(maxlen=max(self.max_lines - 1, 0))
 
         # Create toplevel window
         self.overlay = tk.Toplevel(self.parent.root)
@@ -59,17 +91,18 @@ class FloatingOverlay:
             GWL_EXSTYLE = -20
             WS_EX_NOACTIVATE = 0x08000000
             WS_EX_TOPMOST = 0x00000008
-            hwnd = ctypes.windll.user32.GetParent(self.overlay.winfo_id())
-            style = ctypes.windll.user32.GetWindowLongW(hwnd, GWL_EXSTYLE)
-            ctypes.windll.user32.SetWindowLongW(hwnd, GWL_EXSTYLE, style | WS_EX_NOACTIVATE | WS_EX_TOPMOST)
+            self._hwnd = ctypes.windll.user32.GetParent(self.overlay.winfo_id())
+            style = ctypes.windll.user32.GetWindowLongW(self._hwnd, GWL_EXSTYLE)
+            ctypes.windll.user32.SetWindowLongW(self._hwnd, GWL_EXSTYLE, style | WS_EX_NOACTIVATE | WS_EX_TOPMOST)
         except Exception:
             pass
 
         # Configure dark theme
         self.overlay.configure(bg='#1e1e1e')
 
-        # Create font for measurement
+        # Create font for measurement (line height cached: metrics() is a Tcl round-trip)
         self._font = tkfont.Font(family='Consolas', size=self.font_size)
+        self._line_height = self._font.metrics('linespace')
 
         # Create text widget (no scrollbar — compact popup)
         self.text_widget = tk.Text(
@@ -96,8 +129,10 @@ class FloatingOverlay:
         self._calculate_anchor()
 
         # Start hidden with minimal size
-        initial_height = self._font.metrics('linespace') + 16
-        self.overlay.geometry(f'{self.width}x{initial_height}+{self._anchor_x}+{self._anchor_y}')
+        self._geom_prefix = f'{self.width}x'
+        initial_height = self._line_height + self._padding
+        self.overlay.geometry(f'{self._geom_prefix}{initial_height}{self._anchor_suffix}{self._anchor_y}')
+        self._last_height = initial_height
         self.overlay.withdraw()
         self.is_visible = False
 
@@ -105,20 +140,7 @@ class FloatingOverlay:
         """Calculate the anchor point based on position setting."""
         padding = 20
 
-        try:
-            import ctypes
-            from ctypes import wintypes
-            rect = wintypes.RECT()
-            ctypes.windll.user32.SystemParametersInfoW(0x0030, 0, ctypes.byref(rect), 0)
-            work_left = rect.left
-            work_top = rect.top
-            work_right = rect.right
-            work_bottom = rect.bottom
-        except Exception:
-            work_left = 0
-            work_top = 0
-            work_right = self.parent.root.winfo_screenwidth()
-            work_bottom = self.parent.root.winfo_screenheight() - 48
+        work_left, work_top, work_right, work_bottom = _get_work_area(self.parent.root)
 
         # Anchor = bottom-right corner of overlay area
         if 'right' in self.position:
@@ -132,6 +154,8 @@ class FloatingOverlay:
             # Bottom positions: anchor_y is the bottom edge
             self._anchor_y = work_bottom - padding
 
+        self._anchor_suffix = f'+{self._anchor_x}+'
+
     def _make_draggable(self):
         """Make the overlay window draggable."""
         self._drag_data = {'x': 0, 'y': 0}
@@ -153,59 +177,87 @@ class FloatingOverlay:
         self.text_widget.bind('<B1-Motion>', on_drag)
 
     def update_text(self, text):
-        """Update overlay text (thread-safe). Shows overlay and resets auto-hide timer."""
+        """Update overlay text (thread-safe). Shows overlay and resets auto-hide timer.
+
+        Updates are coalesced: text arriving within ~33ms of a scheduled redraw
+        is appended to the pending buffer, so the overlay repaints at most ~30 Hz.
+        """
         if self.overlay is None:
             return
-        self.parent.root.after(0, self._update_text_impl, text)
+        with self._pending_lock:
+            self._pending_text.append(text)
+            if self._redraw_scheduled:
+                return
+            self._redraw_scheduled = True
+        self.parent.root.after(33, self._flush_pending)
+
+    def _flush_pending(self):
+        """Internal: apply all text queued since the last redraw in one update."""
+        with self._pending_lock:
+            text = ''.join(self._pending_text)
+            self._pending_text.clear()
+            self._redraw_scheduled = False
+        if text:  # Empty when clear_text() dropped the queued text
+            self._update_text_impl(text)
 
     def _update_text_impl(self, text):
         """Internal: update text, resize, show, and schedule auto-hide."""
         if self.text_widget is None:
             return
 
-        # Insert text
-        self.text_widget.config(state=tk.NORMAL)
-        self.text_widget.insert(tk.END, text)
-
-        # Trim to max_lines
-        line_count = int(self.text_widget.index('end-1c').split('.')[0])
-        if line_count > self.max_lines:
-            lines_to_delete = line_count - self.max_lines
-            self.text_widget.delete('1.0', f'{lines_to_delete + 1}.0')
+        # Append to the line buffer; the bounded deque drops lines beyond max_lines
+        parts = (self._current_line + text).split('\n')
+        self._lines.extend(parts[:-1])
+        self._current_line = parts[-1]
 
+        # Replace widget contents in one pass instead of insert-then-trim
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.delete('1.0', tk.END)
+        self.text_widget.insert(tk.END, '\n'.join((*self._lines, self._current_line)))
         self.text_widget.see(tk.END)
         self.text_widget.config(state=tk.DISABLED)
 
         # Calculate dynamic height
-        line_count = int(self.text_widget.index('end-1c').split('.')[0])
-        line_height = self._font.metrics('linespace')
-        padding = 16  # top + bottom pady
+        line_count = len(self._lines) + 1
+        line_height = self._line_height
+        padding = self._padding
         new_height = line_count * line_height + padding
         max_height = 300
         new_height = max(line_height + padding, min(new_height, max_height))
 
-        # Position: grow upward from bottom anchor (or keep custom drag position)
-        if not self._custom_position:
-            if 'bottom' in self.position:
-                y = self._anchor_y - new_height
+        # Position: grow upward from bottom anchor (or keep custom drag position).
+        # Same height means same geometry (dragging moves the window itself), so skip it.
+        if new_height != self._last_height:
+            if not self._custom_position:
+                if 'bottom' in self.position:
+                    y = self._anchor_y - new_height
+                else:
+                    y = self._anchor_y
+                self.overlay.geometry(f'{self._geom_prefix}{new_height}{self._anchor_suffix}{y}')
             else:
-                y = self._anchor_y
-            self.overlay.geometry(f'{self.width}x{new_height}+{self._anchor_x}+{y}')
-        else:
-            # Keep x,y but update height
-            x = self.overlay.winfo_x()
-            y = self.overlay.winfo_y()
-            self.overlay.geometry(f'{self.width}x{new_height}+{x}+{y}')
+                # Keep x,y but update height
+                x = self.overlay.winfo_x()
+                y = self.overlay.winfo_y()
+                self.overlay.geometry(f'{self._geom_prefix}{new_height}+{x}+{y}')
+            self._last_height = new_height
 
         # Show overlay
         if not self.is_visible:
             self.overlay.deiconify()
             self.is_visible = True
 
-        # Reset auto-hide timer (3 seconds)
-        if self._hide_timer:
-            self.parent.root.after_cancel(self._hide_timer)
-        self._hide_timer = self.parent.root.after(3000, self._auto_hide)
+        # Push the auto-hide deadline out (3 seconds); only arm a timer if none is pending
+        self._hide_deadline = time.monotonic() + 3.0
+        if self._hide_timer is None:
+            self._hide_timer = self.parent.root.after(3000, self._check_hide)
+
+    def _check_hide(self):
+        """Hide once the deadline has passed, otherwise re-arm for the time remaining."""
+        remaining = self._hide_deadline - time.monotonic()
+        if remaining > 0:
+            self._hide_timer = self.parent.root.after(int(remaining * 1000) + 1, self._check_hide)
+            return
+        self._auto_hide()
 
     def _auto_hide(self):
         """Auto-hide overlay after timeout."""
@@ -221,6 +273,11 @@ class FloatingOverlay:
 
     def _clear_text_impl(self):
         """Internal: clear text (runs in main thread)."""
+        # Drop text queued for the next coalesced redraw so it isn't drawn after the clear
+        with self._pending_lock:
+            self._pending_text.clear()
+        self._lines.clear()
+        self._current_line = ''
         if self.text_widget is not None:
             self.text_widget.config(state=tk.NORMAL)
             self.text_widget.delete(1.0, tk.END)
@@ -2,13 +2,77 @@
 Transcription module handling Whisper, Google Speech Recognition, and Ollama integration.
 """
 
+import functools
+import importlib.util
 import os
+import queue
+import threading
+import numpy as np
 import speech_recognition as sr
-from .audio_processor import process_audio
+from .audio_processor import process_audio, convert_to_16khz_mono, pcm_to_float32, peak_amplitude
+from .config import (
+    TARGET_SAMPLE_RATE, STREAM_BUFFER_SECONDS, STREAM_VAD_THRESHOLD, STREAM_SILENCE_HOLD
+)
 
 
-# Global variable to cache the Whisper model
+# Global variable to cache the Whisper model (guarded by _whisper_model_lock)
 _whisper_model = None
+_whisper_model_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _whisper_backend():
+    """
+    Return the Whisper backend in use: WHISPER_BACKEND from config, falling
+    back to openai-whisper when faster-whisper is configured but not installed.
+    """
+    from .config import WHISPER_BACKEND
+
+    if WHISPER_BACKEND == "faster-whisper" and importlib.util.find_spec("faster_whisper") is None:
+        print("⚠ faster-whisper is not installed, using openai-whisper (pip install faster-whisper)")
+        return "openai-whisper"
+    return WHISPER_BACKEND
+
+
+def _create_whisper_model(model_name, device):
+    """
+    Construct a Whisper model for the configured backend.
+
+    Args:
+        model_name: size of Whisper model (tiny, base, small, medium, large)
+        device: "cuda" or "cpu"
+
+    Returns:
+        faster_whisper.WhisperModel or openai-whisper model instance
+    """
+    from .config import WHISPER_COMPUTE_TYPE
+
+    if _whisper_backend() == "faster-whisper":
+        from faster_whisper import WhisperModel
+
+        compute_type = WHISPER_COMPUTE_TYPE
+        if compute_type is None:
+            compute_type = "int8_float16" if device == "cuda" else "int8"
+        return WhisperModel(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=os.cpu_count() or 0,
+            num_workers=1
+        )
+
+    import whisper
+    return whisper.load_model(model_name, device=device)
+
+
+def _cuda_available():
+    """Check if CUDA (NVIDIA GPU) is available for the configured backend."""
+    if _whisper_backend() == "faster-whisper":
+        import ctranslate2
+        return ctranslate2.get_cuda_device_count() > 0
+
+    import torch
+    return torch.cuda.is_available()
 
 
 def load_whisper_model(model_name=None):
@@ -16,13 +80,16 @@ def load_whisper_model(model_name=None):
     Load Whisper model (cached for performance).
     Uses NVIDIA GPU if available, falls back to CPU.
 
+    The backend is selected by WHISPER_BACKEND in config: faster-whisper
+    (CTranslate2, INT8 weights) by default, or openai-whisper. If
+    faster-whisper is not installed, openai-whisper is used instead.
+
     Args:
         model_name: size of Whisper model (tiny, base, small, medium, large)
 
     Returns:
         Whisper model instance
     """
-    import whisper
     from .config import WHISPER_MODEL
 
     if model_name is None:
@@ -31,29 +98,78 @@ def load_whisper_model(model_name=None):
     global _whisper_model
 
     if _whisper_model is None:
-        import torch
-
-        # Check if CUDA (NVIDIA GPU) is available
-        device = "cuda" if torch.cuda.is_available() else "cpu"
+        with _whisper_model_lock:
+            # Re-check: another thread may have loaded it while we waited
+            if _whisper_model is None:
+                device = "cuda" if _cuda_available() else "cpu"
 
-        print(f"Loading Whisper model on {device.upper()}...")
-        _whisper_model = whisper.load_model(model_name, device=device)
+                print(f"Loading Whisper model on {device.upper()}...")
+                _whisper_model = _create_whisper_model(model_name, device)
 
     return _whisper_model
 
 
-def transcribe_with_whisper(audio_path, language=None):
+def warmup_whisper_model():
+    """
+    Load the Whisper model and run one dummy transcription.
+
+    Meant to run on a background thread at startup so the first real
+    request doesn't pay for model loading and first-inference warmup.
+    """
+    try:
+        # Bypass faster-whisper's VAD filter, which would drop the silent input
+        options = {"vad_filter": False} if _whisper_backend() == "faster-whisper" else {}
+        silence = np.zeros(15 * TARGET_SAMPLE_RATE, dtype=np.float32)
+        _run_whisper(load_whisper_model(), silence, options)
+        print("Whisper model warmed up")
+    except Exception as e:
+        print(f"⚠ Whisper warmup failed: {str(e)}")
+
+
+def _run_whisper(model, audio, options):
+    """
+    Run a transcription and return an openai-whisper style result dict.
+
+    faster-whisper returns a lazy segment generator plus an info object;
+    this normalizes it to {"text", "language", "segments": [{"words": ...}]}.
+    """
+    if _whisper_backend() != "faster-whisper":
+        return model.transcribe(audio, **options)
+
+    fw_options = {"beam_size": 1, "vad_filter": True}
+    fw_options.update(options)
+    segments, info = model.transcribe(audio, **fw_options)
+    segments = list(segments)
+    return {
+        "text": "".join(seg.text for seg in segments),
+        "language": info.language,
+        "segments": [
+            {
+                "words": [
+                    {"word": w.word, "start": w.start, "end": w.end}
+                    for w in (seg.words or [])
+                ]
+            }
+            for seg in segments
+        ]
+    }
+
+
+def transcribe_with_whisper(audio, language=None, word_timestamps=False):
     """
-    Transcribe audio file using Whisper with GPU fallback to CPU.
+    Transcribe audio using Whisper with GPU fallback to CPU.
 
     Args:
-        audio_path: path to audio file
+        audio: float32 mono 16kHz numpy array (as returned by process_audio),
+            or a path to an audio file
         language: language code (e.g., "en", "es") or None for auto-detect
+        word_timestamps: also return per-word timings
 
     Returns:
         dict: {
             "text": transcribed text,
-            "language": detected language
+            "language": detected language,
+            "words": list of {"word", "start", "end"} (only with word_timestamps)
         }
     """
     try:
@@ -67,33 +183,71 @@ def transcribe_with_whisper(audio_path, language=None):
         options = {}
         if language and language != "auto":
             options["language"] = language
+        if word_timestamps:
+            options["word_timestamps"] = True
 
         try:
-            result = model.transcribe(audio_path, **options)
+            result = _run_whisper(model, audio, options)
         except (RuntimeError, ValueError) as e:
             # GPU error detected (NaN values, CUDA errors, constraint violations)
             error_msg = str(e)
             if "nan" in error_msg.lower() or "cuda" in error_msg.lower() or "constraint" in error_msg.lower():
                 # Reload model on CPU and retry
-                import torch
-                import whisper
                 from .config import WHISPER_MODEL
                 global _whisper_model
                 print("⚠ GPU error detected (NaN/CUDA issue), falling back to CPU...")
-                _whisper_model = whisper.load_model(WHISPER_MODEL, device="cpu")
-                model = _whisper_model
-                result = model.transcribe(audio_path, **options)
+                with _whisper_model_lock:
+                    _whisper_model = _create_whisper_model(WHISPER_MODEL, "cpu")
+                    model = _whisper_model
+                result = _run_whisper(model, audio, options)
             else:
                 raise
 
-        return {
+        output = {
             "text": result["text"].strip(),
             "language": result.get("language", "unknown")
         }
+        if word_timestamps:
+            output["words"] = [
+                {"word": w["word"], "start": w["start"], "end": w["end"]}
+                for segment in result.get("segments", [])
+                for w in segment.get("words", [])
+            ]
+        return output
     except Exception as e:
         raise Exception(f"Whisper transcription failed: {str(e)}")
 
 
+# Whisper-style language codes -> Google Speech Recognition locale codes
+_GOOGLE_LANG_MAP = {
+    "yue": "yue-HK",  # Cantonese (Hong Kong)
+    "zh": "zh-CN",    # Chinese (Mandarin)
+    "en": "en-US",    # English
+    "es": "es-ES",    # Spanish
+    "fr": "fr-FR",    # French
+    "de": "de-DE",    # German
+    "ja": "ja-JP",    # Japanese
+    "ko": "ko-KR",    # Korean
+    "pt": "pt-PT",    # Portuguese
+    "ru": "ru-RU",    # Russian
+    "it": "it-IT"     # Italian
+}
+
+# Shared Recognizer (recognize_google keeps no per-call state on it)
+_recognizer = None
+_recognizer_lock = threading.Lock()
+
+
+def _get_recognizer():
+    """Return the shared speech_recognition Recognizer, creating it on first use."""
+    global _recognizer
+    if _recognizer is None:
+        with _recognizer_lock:
+            if _recognizer is None:
+                _recognizer = sr.Recognizer()
+    return _recognizer
+
+
 def transcribe_with_google(audio_path, language=None):
     """
     Transcribe audio file using Google Speech Recognition.
@@ -101,7 +255,9 @@ def transcribe_with_google(audio_path, language=None):
 
     Args:
         audio_path: path to audio file
-        language: language code (e.g., "en-US", "yue-HK") or None for auto-detect
+        language: Whisper-style language code (e.g., "en", "yue"), mapped to a Google
+            locale via _GOOGLE_LANG_MAP (unmapped codes are passed through), or None
+            for auto-detect
 
     Returns:
         dict: {
@@ -110,53 +266,83 @@ def transcribe_with_google(audio_path, language=None):
         }
     """
     try:
-        recognizer = sr.Recognizer()
-
-        # Map language codes to Google SR format
-        lang_map = {
-            "yue": "yue-HK",  # Cantonese (Hong Kong)
-            "zh": "zh-CN",    # Chinese (Mandarin)
-            "en": "en-US",    # English
-            "es": "es-ES",    # Spanish
-            "fr": "fr-FR",    # French
-            "de": "de-DE",    # German
-            "ja": "ja-JP",    # Japanese
-            "ko": "ko-KR",    # Korean
-            "pt": "pt-PT",    # Portuguese
-            "ru": "ru-RU",    # Russian
-            "it": "it-IT"     # Italian
-        }
-
-        # Convert language code
-        google_lang = lang_map.get(language, language) if language else None
+        recognizer = _get_recognizer()
 
         # Load audio file
         with sr.AudioFile(audio_path) as source:
             audio_data = recognizer.record(source)
 
-        # Transcribe using Google Speech Recognition
-        try:
-            if google_lang:
-                text = recognizer.recognize_google(audio_data, language=google_lang)
-            else:
-                text = recognizer.recognize_google(audio_data)  # Auto-detect
+        return _recognize_google(audio_data, language)
 
-            return {
-                "text": text.strip(),
-                "language": language if language else "auto"
-            }
-        except sr.UnknownValueError:
-            return {
-                "text": "",
-                "language": language if language else "unknown"
-            }
-        except sr.RequestError as e:
-            raise Exception(f"Google Speech Recognition service error: {str(e)}")
+    except Exception as e:
+        raise Exception(f"Google transcription failed: {str(e)}")
+
+
+def transcribe_with_google_array(audio, sample_rate, language=None):
+    """
+    Transcribe an in-memory float32 audio array using Google Speech Recognition.
+    Same as transcribe_with_google, without the temp WAV file round-trip.
+
+    Args:
+        audio: 1D float32 numpy array normalized to [-1, 1]
+        sample_rate: sample rate of audio in Hz
+        language: Whisper-style language code (e.g., "en", "yue"), mapped to a Google
+            locale via _GOOGLE_LANG_MAP (unmapped codes are passed through), or None
+            for auto-detect
+
+    Returns:
+        dict: {
+            "text": transcribed text,
+            "language": detected/specified language
+        }
+    """
+    try:
+        # 16-bit PCM, as save_temp_audio would have written it (scale and clip in one scratch array)
+        pcm = np.multiply(audio, 32767.0, dtype=np.float32)
+        np.clip(pcm, -32767.0, 32767.0, out=pcm)
+        audio_data = sr.AudioData(pcm.astype(np.int16).tobytes(), sample_rate, 2)
+        return _recognize_google(audio_data, language)
 
     except Exception as e:
         raise Exception(f"Google transcription failed: {str(e)}")
 
 
+def _recognize_google(audio_data, language):
+    """
+    Send sr.AudioData to Google Speech Recognition.
+
+    Args:
+        audio_data: speech_recognition AudioData
+        language: Whisper-style language code (mapped via _GOOGLE_LANG_MAP) or None for auto-detect
+
+    Returns:
+        dict: {"text": ..., "language": ...}
+    """
+    recognizer = _get_recognizer()
+
+    # Convert language code
+    google_lang = _GOOGLE_LANG_MAP.get(language, language) if language else None
+
+    # Transcribe using Google Speech Recognition
+    try:
+        if google_lang:
+            text = recognizer.recognize_google(audio_data, language=google_lang)
+        else:
+            text = recognizer.recognize_google(audio_data)  # Auto-detect
+
+        return {
+            "text": text.strip(),
+            "language": language if language else "auto"
+        }
+    except sr.UnknownValueError:
+        return {
+            "text": "",
+            "language": language if language else "unknown"
+        }
+    except sr.RequestError as e:
+        raise Exception(f"Google Speech Recognition service error: {str(e)}")
+
+
 def process_with_ollama(text, task="improve"):
     """
     Process transcribed text using Ollama.
@@ -202,49 +388,249 @@ def process_with_ollama(text, task="improve"):
         raise Exception(f"Ollama processing failed: {str(e)}")
 
 
-def transcribe_audio_stream(audio_tuple, language="auto"):
+def _load_vad():
+    """Create a Silero VAD instance, or return None if it is unavailable."""
+    try:
+        from .vad import SileroVAD
+        return SileroVAD()
+    except Exception as e:
+        print(f"Silero VAD not available ({e}), using amplitude detection for streaming")
+        return None
+
+
+class StreamingState:
+    """
+    Per-session state for real-time transcription.
+
+    Keeps a bounded buffer of not-yet-committed audio and applies the
+    LocalAgreement-2 policy: a word is committed only once two consecutive
+    Whisper rounds agree on it, after which its audio is dropped from the
+    buffer. Each round therefore only re-transcribes the uncommitted tail.
+
+    Whisper runs on a worker thread so the Gradio stream callback only
+    appends audio and returns the latest published transcript. Wakeups go
+    through a single-slot queue: while a round is running, further chunks
+    coalesce into one pending wakeup instead of backing up.
+
+    A per-session Silero VAD marks where speech last ended; rounds are
+    skipped during pauses and trailing silence is not sent to Whisper.
+    """
+
+    _VAD_FRAME = 512  # Silero VAD frame size at 16kHz
+    # Silence kept on either side of speech when trimming the buffer (seconds)
+    _SILENCE_PAD = 0.2
+
+    # Worker thread exits after this many seconds without new audio
+    _IDLE_TIMEOUT = 60
+
+    def __init__(self, max_seconds=STREAM_BUFFER_SECONDS):
+        self.max_samples = int(max_seconds * TARGET_SAMPLE_RATE)
+        # Preallocated ring buffer: appends copy only the new chunk
+        self._ring = np.zeros(self.max_samples, dtype=np.float32)
+        self._end = 0  # Absolute sample index one past the newest sample
+        self.buf_start = 0  # Absolute sample index of the oldest uncommitted sample
+        self.committed_text = ""
+        self.last_hypothesis = []
+        self.language = None
+        self.latest_text = ""
+        self.vad = _load_vad()
+        self._vad_pending = np.zeros(0, dtype=np.float32)  # Samples short of a full VAD frame
+        # Absolute sample index where the last speech frame ended
+        # (starts a full buffer in the past: no speech heard yet)
+        self._speech_end = -self.max_samples
+        self._lock = threading.Lock()
+        self._wake = queue.Queue(maxsize=1)
+        self._worker = None
+
+    def detect_speech(self, audio):
+        """
+        Run VAD over a new chunk (call before append()).
+
+        Args:
+            audio: 16kHz float32 samples about to be appended
+
+        Returns:
+            bool: True if any complete frame in the chunk contains speech
+        """
+        frame = self._VAD_FRAME
+        samples = np.concatenate((self._vad_pending, audio))
+        usable = len(samples) // frame * frame
+        self._vad_pending = samples[usable:]
+        # Absolute sample index of samples[0]
+        pos = self._end - (len(samples) - len(audio))
+
+        if not usable:
+            return False
+        frames = samples[:usable].reshape(-1, frame)
+        if self.vad is not None:
+            voiced = np.flatnonzero(self.vad.process_batch(frames) >= STREAM_VAD_THRESHOLD)
+        else:
+            voiced = [i for i in range(len(frames)) if peak_amplitude(frames[i]) >= 0.01]
+        if not len(voiced):
+            return False
+        self._speech_end = pos + (int(voiced[-1]) + 1) * frame
+        return True
+
+    def seconds_since_speech(self):
+        """Seconds of audio received since the last speech frame."""
+        return (self._end - self._speech_end) / TARGET_SAMPLE_RATE
+
+    def append(self, audio):
+        """Append 16kHz float32 samples, keeping at most max_samples."""
+        size = self.max_samples
+        n = len(audio)
+        with self._lock:
+            if n > size:
+                # Chunk alone overflows the ring: keep only its newest samples
+                self._end += n - size
+                audio = audio[-size:]
+                n = size
+
+            w = self._end % size
+            first = min(n, size - w)
+            self._ring[w:w + first] = audio[:first]
+            self._ring[:n - first] = audio[first:]
+
+            self._end += n
+            self.buf_start = max(self.buf_start, self._end - size)
+
+            # No uncommitted speech yet: keep only a short lead-in of silence
+            if self._speech_end <= self.buf_start:
+                pad = int(self._SILENCE_PAD * TARGET_SAMPLE_RATE)
+                self.buf_start = max(self.buf_start, self._end - pad)
+
+    def snapshot(self):
+        """Return (audio, buf_start, language) for one transcription round.
+
+        The uncommitted span is copied out of the ring once per round,
+        trimmed to end shortly after the last speech frame.
+        """
+        size = self.max_samples
+        with self._lock:
+            stop = min(self._end, self._speech_end + int(self._SILENCE_PAD * TARGET_SAMPLE_RATE))
+            filled = max(0, stop - self.buf_start)
+            start = self.buf_start % size
+            if start + filled <= size:
+                audio = self._ring[start:start + filled].copy()
+            else:
+                audio = np.concatenate((self._ring[start:], self._ring[:start + filled - size]))
+            return audio, self.buf_start, self.language
+
+    def update(self, words, snap_start):
+        """
+        Commit the words this round agrees on with the previous one.
+
+        Args:
+            words: list of {"word", "start", "end"} for the snapshot audio
+            snap_start: buf_start at the time the snapshot was taken
+
+        Returns:
+            str: committed text followed by the still-tentative hypothesis
+        """
+        current = [w["word"] for w in words]
+
+        with self._lock:
+            # Longest common prefix with the previous round's hypothesis
+            agreed = 0
+            for prev, cur in zip(self.last_hypothesis, current):
+                if prev.strip().lower() != cur.strip().lower():
+                    break
+                agreed += 1
+
+            if agreed:
+                self.committed_text += "".join(current[:agreed])
+                # Drop the committed words' audio so the next round starts after them
+                cut = snap_start + int(words[agreed - 1]["end"] * TARGET_SAMPLE_RATE)
+                self.buf_start = max(self.buf_start, min(cut, self._end))
+
+            self.last_hypothesis = current[agreed:]
+            self.latest_text = (self.committed_text + "".join(self.last_hypothesis)).strip()
+            return self.latest_text
+
+    def submit(self):
+        """Wake the worker (starting it if needed); no-op if a wakeup is already pending."""
+        with self._lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            try:
+                self._wake.put_nowait(None)
+            except queue.Full:
+                pass
+
+    def _run(self):
+        """Worker loop: transcribe the current buffer once per wakeup."""
+        while True:
+            try:
+                self._wake.get(timeout=self._IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    if self._wake.empty():
+                        self._worker = None
+                        return
+                continue
+
+            audio, snap_start, language = self.snapshot()
+            if len(audio) == 0:
+                continue
+
+            try:
+                result = transcribe_with_whisper(audio, language, word_timestamps=True)
+                self.update(result["words"], snap_start)
+            except Exception as e:
+                self.latest_text = f"[Error: {str(e)}]"
+
+
+def transcribe_audio_stream(audio_tuple, language="auto", state=None):
     """
     Real-time streaming transcription function.
 
+    Appends the chunk to the session buffer, wakes the session's Whisper
+    worker and returns immediately with the latest published transcript.
+
     Args:
-        audio_tuple: tuple of (sample_rate, audio_data) from Gradio streaming
+        audio_tuple: tuple of (sample_rate, audio_chunk) from Gradio streaming
         language: language code or "auto" for detection
+        state: StreamingState for this session (created when recording starts;
+            created here if the stream starts without one)
 
     Returns:
-        str: transcription text (partial or complete)
+        tuple: (transcription_text, state)
     """
+    if state is None:
+        state = StreamingState()
+
     try:
         # Validate input
         if audio_tuple is None or audio_tuple[1] is None:
-            return ""
+            return state.latest_text, state
 
         sample_rate, audio_data = audio_tuple
 
         # Check if audio is empty
         if len(audio_data) == 0:
-            return ""
+            return state.latest_text, state
 
-        # Process audio
-        temp_path, duration, _ = process_audio(audio_data, sample_rate)
+        # Convert the new chunk only; the session buffer is already 16kHz float32
+        audio_data, _ = convert_to_16khz_mono(pcm_to_float32(audio_data), sample_rate)
 
         # Map language code (yue -> zh for Cantonese)
         lang = language if language != "auto" else None
         if lang == "yue":
             lang = "zh"
+        state.language = lang
 
-        # Transcribe with Whisper
-        result = transcribe_with_whisper(temp_path, lang)
+        is_speech = state.detect_speech(audio_data)
+        state.append(audio_data)
 
-        # Clean up temporary file
-        try:
-            os.unlink(temp_path)
-        except Exception:
-            pass
+        # Skip Whisper during pauses: nothing new to transcribe, reuse the last text
+        if is_speech or state.seconds_since_speech() <= STREAM_SILENCE_HOLD:
+            state.submit()
 
-        return result["text"]
+        return state.latest_text, state
 
     except Exception as e:
-        return f"[Error: {str(e)}]"
+        return f"[Error: {str(e)}]", state
 
 
 def transcribe_audio(audio_tuple, language="auto", use_ollama=False, ollama_task="improve"):
@@ -273,7 +659,7 @@ def transcribe_audio(audio_tuple, language="auto", use_ollama=False, ollama_task
 
         # Process audio
         status = "Processing audio..."
-        temp_path, duration, warning = process_audio(audio_data, sample_rate)
+        audio_data, duration, warning = process_audio(audio_data, sample_rate)
 
         # Add warning to status if audio is too long
         if warning:
@@ -282,19 +668,13 @@ def transcribe_audio(audio_tuple, language="auto", use_ollama=False, ollama_task
         # Transcribe with Whisper
         status += "\nTranscribing with Whisper..."
         result = transcribe_with_whisper(
-            temp_path,
+            audio_data,
             language=language if language != "auto" else None
         )
 
         transcription = result["text"]
         detected_lang = result["language"]
 
-        # Clean up temporary file
-        try:
-            os.unlink(temp_path)
-        except Exception:
-            pass  # Ignore cleanup errors
-
         # Enhance with Ollama if requested
         if use_ollama and transcription:
             status += "\nEnhancing with Ollama..."
@@ -5,9 +5,25 @@ Main Gradio application interface
 
 import gradio as gr
 import shutil
+import threading
+import functools
 import ollama
-from .transcription import transcribe_audio, transcribe_audio_stream
-from .config import GRADIO_THEME, SHARE_LINK, OLLAMA_MODEL
+from .transcription import transcribe_audio, transcribe_audio_stream, warmup_whisper_model, StreamingState
+from .config import GRADIO_THEME, SHARE_LINK, OLLAMA_MODEL, LANGUAGE_CHOICES, OLLAMA_TASK_CHOICES
+
+
+@functools.lru_cache(maxsize=1)
+def _ollama_models():
+    """
+    Return the names of locally available Ollama models (cached for app lifetime).
+
+    Returns:
+        frozenset of model names, or None if Ollama is not reachable
+    """
+    try:
+        return frozenset(m.model for m in ollama.list().models)
+    except Exception:
+        return None
 
 
 def check_prerequisites():
@@ -22,16 +38,14 @@ def check_prerequisites():
         messages.append("❌ ffmpeg not found. Please install ffmpeg for audio processing.")
 
     # Check Ollama (optional for basic transcription)
-    try:
-        # Check if gemma3n:e4b model is available
-        models = ollama.list()
-        model_names = [m.model for m in models.models]
-        if OLLAMA_MODEL not in model_names:
-            messages.append(f"⚠ Warning: {OLLAMA_MODEL} model not found. Run: ollama pull {OLLAMA_MODEL}")
-        else:
-            messages.append(f"✓ Ollama is running with {OLLAMA_MODEL}")
-    except Exception:
+    model_names = _ollama_models()
+    if model_names is None:
         messages.append("⚠ Warning: Ollama is not running. Transcription will work, but enhancement features will be unavailable.")
+    elif OLLAMA_MODEL not in model_names:
+        # Check if gemma3n:e4b model is available
+        messages.append(f"⚠ Warning: {OLLAMA_MODEL} model not found. Run: ollama pull {OLLAMA_MODEL}")
+    else:
+        messages.append(f"✓ Ollama is running with {OLLAMA_MODEL}")
 
     if not messages:
         messages.append("✓ All prerequisites are met!")
@@ -39,6 +53,14 @@ def check_prerequisites():
     return len([m for m in messages if m.startswith("❌")]) == 0, "\n".join(messages)
 
 
+def refresh_prerequisites():
+    """
+    Drop the cached Ollama model list and re-run the prerequisite checks.
+    """
+    _ollama_models.cache_clear()
+    return check_prerequisites()[1]
+
+
 def toggle_ollama_task(use_ollama):
     """
     Show/hide Ollama task dropdown based on checkbox.
@@ -54,13 +76,22 @@ def create_interface():
     # Check prerequisites on startup
     prereq_success, prereq_message = check_prerequisites()
 
+    # Load and warm up Whisper in the background so the first request is fast
+    threading.Thread(target=warmup_whisper_model, daemon=True).start()
+
     with gr.Blocks(title="Speech-to-Text") as app:
         gr.Markdown("# 🎤 Speech-to-Text Application")
         gr.Markdown("Powered by OpenAI Whisper and Ollama gemma3n:e4b")
 
         # Display prerequisites status
         with gr.Accordion("System Status", open=not prereq_success):
-            gr.Markdown(prereq_message)
+            prereq_status = gr.Markdown(prereq_message)
+            refresh_btn = gr.Button("🔄 Refresh", size="sm")
+
+        refresh_btn.click(
+            fn=refresh_prerequisites,
+            outputs=[prereq_status]
+        )
 
         # Create tabs for different modes
         with gr.Tabs() as tabs:
@@ -72,6 +103,9 @@ def create_interface():
             with gr.Tab("⚡ Real-time Streaming"):
                 _create_streaming_mode()
 
+    # Single-flight queue: a busy handler makes new events wait rather than run concurrently
+    app.queue(default_concurrency_limit=1, api_open=False)
+
     return app
 
 
@@ -89,20 +123,7 @@ def _create_record_mode():
             )
 
             language = gr.Dropdown(
-                choices=[
-                    ("Auto-detect", "auto"),
-                    ("English", "en"),
-                    ("Spanish", "es"),
-                    ("French", "fr"),
-                    ("German", "de"),
-                    ("Chinese (Mandarin)", "zh"),
-                    ("Cantonese", "yue"),
-                    ("Japanese", "ja"),
-                    ("Korean", "ko"),
-                    ("Portuguese", "pt"),
-                    ("Russian", "ru"),
-                    ("Italian", "it")
-                ],
+                choices=LANGUAGE_CHOICES,
                 value="auto",
                 label="Language"
             )
@@ -116,11 +137,7 @@ def _create_record_mode():
             )
 
             ollama_task = gr.Dropdown(
-                choices=[
-                    ("Improve Grammar & Punctuation", "improve"),
-                    ("Summarize in Bullet Points", "summarize"),
-                    ("Translate to Spanish", "translate")
-                ],
+                choices=OLLAMA_TASK_CHOICES,
                 value="improve",
                 label="Enhancement Task",
                 visible=False
@@ -202,20 +219,7 @@ def _create_streaming_mode():
             )
 
             stream_language = gr.Dropdown(
-                choices=[
-                    ("Auto-detect", "auto"),
-                    ("English", "en"),
-                    ("Spanish", "es"),
-                    ("French", "fr"),
-                    ("German", "de"),
-                    ("Chinese (Mandarin)", "zh"),
-                    ("Cantonese", "yue"),
-                    ("Japanese", "ja"),
-                    ("Korean", "ko"),
-                    ("Portuguese", "pt"),
-                    ("Russian", "ru"),
-                    ("Italian", "it")
-                ],
+                choices=LANGUAGE_CHOICES,
                 value="auto",
                 label="Language"
             )
@@ -228,11 +232,27 @@ def _create_streaming_mode():
                 interactive=False
             )
 
-    # Wire up streaming
+    # Per-session StreamingState (created fresh when each recording starts)
+    stream_state = gr.State(None)
+
+    # Start each recording with a fresh buffer and transcript. It shares the stream's
+    # single-slot queue, so the state exists before the first chunk is handled.
+    stream_audio.start_recording(
+        fn=lambda: StreamingState(),
+        outputs=[stream_state],
+        concurrency_limit=1,
+        concurrency_id="stream"
+    )
+
+    # Wire up streaming: one FIFO slot keeps each session's chunks in order, and every
+    # chunk is delivered (the handler only appends to the buffer and returns)
     stream_audio.stream(
         fn=transcribe_audio_stream,
-        inputs=[stream_audio, stream_language],
-        outputs=[stream_output]
+        inputs=[stream_audio, stream_language, stream_state],
+        outputs=[stream_output, stream_state],
+        concurrency_limit=1,
+        concurrency_id="stream",
+        trigger_mode="multiple"
     )
 
     with gr.Accordion("💡 Real-time Tips", open=False):